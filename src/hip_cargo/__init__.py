@@ -1,7 +1,5 @@
 """hip-cargo: Tools for generating Stimela cab definitions."""
 
-from upath import UPath
-
 from hip_cargo.utils.config import get_container_image
 from hip_cargo.utils.decorators import stimela_cab, stimela_output
 from hip_cargo.utils.diagnostics import annotate_diagnostics
@@ -37,3 +35,12 @@ __all__ = [
     "parse_list_str",
     "parse_upath",
 ]
+
+
+def __getattr__(name: str):
+    # UPath pulls in fsspec (~100 ms); only import it when actually requested
+    if name == "UPath":
+        from upath import UPath
+
+        return UPath
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ import typer
 
 from hip_cargo import StimelaMeta, parse_upath, stimela_cab, stimela_output
 
+Directory = NewType("Directory", Path)
 File = NewType("File", Path)
 
 
@@ -47,6 +48,14 @@ def generate_function(
             rich_help_panel="Inputs",
         ),
     ] = None,
+    build_cache_dir: Annotated[
+        Directory | None,
+        typer.Option(
+            parser=parse_upath,
+            help="Optional directory for caching parsed cab definitions between runs.",
+            rich_help_panel="Inputs",
+        ),
+    ] = None,
     backend: Annotated[
         Literal["auto", "native", "apptainer", "singularity", "docker", "podman"],
         typer.Option(
@@ -79,6 +88,7 @@ def generate_function(
                 dict(
                     cab_file=cab_file,
                     config_file=config_file,
+                    build_cache_dir=build_cache_dir,
                     output_file=output_file,
                 ),
             )
@@ -91,6 +101,7 @@ def generate_function(
                 cab_file,
                 output_file,
                 config_file=config_file,
+                build_cache_dir=build_cache_dir,
             )
             return
         except ImportError:
@@ -110,6 +121,7 @@ def generate_function(
         dict(
             cab_file=cab_file,
             config_file=config_file,
+            build_cache_dir=build_cache_dir,
             output_file=output_file,
         ),
         image=image,
@@ -27,27 +27,34 @@ def generate_cabs(module: list[Path], image: str | None = None, output_dir: Path
     Raises:
         RuntimeError: If module paths are invalid or don't follow expected layout.
     """
-    # glob if wildcard in module
-    modlist = []
+    # glob if wildcard in module; overlapping patterns yield each file once
+    modset: set[Path] = set()
+    # The image is derived from the first module argument, not the first sorted module
+    first_mod: Path | None = None
     for modpath in module:
         if not isinstance(modpath, Path):
             modpath = Path(modpath)
         if "*" in str(modpath):
             base_path = modpath.parent
             pattern = modpath.name
-            modlist.extend([f for f in base_path.glob(pattern) if f.is_file() and not f.name.startswith("__")])
-            if len(modlist) == 0:
+            matches = [f for f in base_path.glob(pattern) if f.is_file() and not f.name.startswith("__")]
+            if not matches:
                 raise RuntimeError(f"No modules found matching {modpath}")
+            modset.update(matches)
+            if first_mod is None:
+                first_mod = min(matches)
         else:
             if not modpath.is_file():
                 raise RuntimeError(f"No module file found at {modpath}")
-            modlist.append(modpath)
+            modset.add(modpath)
+            if first_mod is None:
+                first_mod = modpath
+    modlist = sorted(modset)
 
     # Resolve image from installed package metadata when not explicitly provided.
     # Derive distribution name from module path: src/<package>/cli/module.py
     # The first component after src/ is the Python import name.
-    if image is None:
-        first_mod = modlist[0]
+    if image is None and first_mod is not None:
         parts = first_mod.parts
         try:
             src_idx = parts.index("src")
@@ -1,11 +1,14 @@
 """Core logic for generating Python functions from Stimela cab definitions."""
 
+import hashlib
+import json
+import os
 import subprocess
+import tempfile
 import warnings
 from pathlib import Path
 
-import yaml
-
+from hip_cargo import __version__
 from hip_cargo.utils.cab_to_function import (
     LIST_TYPE_PARSERS,
     STIMELA_DTYPE_TO_LIST_TYPE,
@@ -14,11 +17,101 @@ from hip_cargo.utils.cab_to_function import (
     generate_function_body,
     generate_parameter_signature,
     split_info_at_periods,
+    unwrap_optional_dtype,
 )
 from hip_cargo.utils.yaml_comments import extract_yaml_comments
 
+# Escapes double quotes in info strings emitted inside "..." literals
+_ESCAPE_TABLE = str.maketrans({'"': '\\"'})
+
+
+def _parse_cab(cab_file: Path) -> tuple[dict, dict[str, str]]:
+    """Parse a cab YAML file and extract its inline comments."""
+    import yaml  # deferred: only needed when a cab is actually parsed
+
+    yaml_comments = extract_yaml_comments(cab_file)
+    with open(cab_file) as f:
+        data = yaml.safe_load(f)
+    return data, yaml_comments
+
+
+def _load_cab(cab_file: Path, cache_dir: Path | None = None) -> tuple[dict, dict[str, str]]:
+    """Load a cab definition and its inline comments, optionally via a build cache.
+
+    Cab YAMLs rarely change between runs (e.g. CI regenerating every CLI), so the
+    parsed ``(data, comments)`` pair is stored as JSON in
+    ``<cache_dir>/<sha1(path)>.json`` and reused for as long as the cab file's
+    mtime, size and the hip-cargo version are unchanged. Unreadable, malformed or
+    stale cache entries are silently rebuilt, and cabs that do not survive a JSON
+    round trip (e.g. YAML dates or non-string keys) are never cached. Entries are
+    written atomically, and a cache that cannot be written is skipped.
+
+    Args:
+        cab_file: Path to the YAML cab definition file.
+        cache_dir: Optional cache directory. If None, the cab is always parsed.
+
+    Returns:
+        Tuple of ``(data, yaml_comments)``.
+    """
+    if cache_dir is None:
+        return _parse_cab(cab_file)
+
+    resolved = Path(cab_file).resolve()
+    cab_stat = resolved.stat()
+    # Size catches same-tick edits on filesystems with coarse mtimes
+    mtime, size = cab_stat.st_mtime_ns, cab_stat.st_size
+    cache_file = Path(cache_dir) / f"{hashlib.sha1(str(resolved).encode()).hexdigest()}.json"
+
+    if cache_file.is_file():
+        try:
+            entry = json.loads(cache_file.read_text())
+            if entry["version"] == __version__ and entry["mtime"] == mtime and entry["size"] == size:
+                data, yaml_comments = entry["data"], entry["comments"]
+                if isinstance(data, dict) and isinstance(yaml_comments, dict):
+                    return data, yaml_comments
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+    data, yaml_comments = _parse_cab(cab_file)
+    entry = {"version": __version__, "mtime": mtime, "size": size, "data": data, "comments": yaml_comments}
+    try:
+        payload = json.dumps(entry)
+    except (TypeError, ValueError):
+        return data, yaml_comments
+    # JSON silently stringifies non-string keys, so only cache exact round trips
+    if json.loads(payload) == entry:
+        _write_cache_entry(cache_file, payload)
+    return data, yaml_comments
+
+
+def _write_cache_entry(cache_file: Path, payload: str) -> None:
+    """Atomically write a build cache entry, ignoring an unwritable cache.
 
-def generate_function(cab_file: Path, output_file: Path, config_file: Path | None = None) -> None:
+    The payload goes to a temporary file in the same directory and is then
+    renamed into place, so concurrent runs never see a truncated entry.
+    """
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.stem}.", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        # The cache is an optimization; a read-only or full cache dir must not fail the build
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def generate_function(
+    cab_file: Path,
+    output_file: Path,
+    config_file: Path | None = None,
+    build_cache_dir: Path | None = None,
+) -> None:
     """
     Generate a Python function from a Stimela cab definition.
 
@@ -26,6 +119,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         cab_file: Path to the YAML cab definition file.
         output_file: Path where the Python function should be written.
         config_file: Optional path to ruff config file to use when formatting the generated code.
+        build_cache_dir: Optional directory for caching parsed cab definitions between runs.
 
     Raises:
         FileNotFoundError: If the cab file doesn't exist
@@ -40,12 +134,8 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
     else:
         print(f"Loading cab definition from: {cab_file}")
 
-    # Extract inline comments from YAML file
-    yaml_comments = extract_yaml_comments(cab_file)
-
-    # load cab definition
-    with open(cab_file) as f:
-        data = yaml.safe_load(f)
+    # Load cab definition and its inline comments (from the build cache if fresh)
+    data, yaml_comments = _load_cab(cab_file, build_cache_dir)
 
     if "cabs" not in data:
         raise ValueError(f"Invalid cab file format: missing 'cabs' key in {cab_file}")
@@ -129,7 +219,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
     for param_def in all_params.values():
         dtype = param_def.get("dtype", "str")
         # Unwrap Optional[...] for list type detection
-        lookup_dtype = dtype[9:-1] if dtype.startswith("Optional[") and dtype.endswith("]") else dtype
+        lookup_dtype, _ = unwrap_optional_dtype(dtype)
         if lookup_dtype in STIMELA_DTYPE_TO_LIST_TYPE:
             list_types_used.add(STIMELA_DTYPE_TO_LIST_TYPE[lookup_dtype])
 
@@ -177,7 +267,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         if "\n" in info_split:
             # Multi-line info
             info_lines = info_split.split("\n")
-            info_lines_escaped = [line.replace('"', '\\"') for line in info_lines]
+            info_lines_escaped = [line.translate(_ESCAPE_TABLE) for line in info_lines]
             if len(info_lines_escaped) > 1:
                 lines.append(f'    info="{info_lines_escaped[0]} "')
                 for line in info_lines_escaped[1:-1]:
@@ -194,7 +284,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
                     lines.append(f'    info="{info_lines_escaped[0]}",')
         else:
             # Single line info
-            info_escaped = info_split.replace('"', '\\"')
+            info_escaped = info_split.translate(_ESCAPE_TABLE)
             if trailing_comment:
                 lines.append(f'    info="{info_escaped}",{trailing_comment}')
             else:
@@ -210,11 +300,13 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
 
     # Output decorators
     for output_name, output_def in outputs.items():
-        # Sanitize output name
+        # Look up each field once; info already has its comment applied from earlier
         output_dtype = output_def.get("dtype", "File")
-        # Get info - already has comment applied from earlier
         output_info_raw = output_def.get("info", "")
         output_required = output_def.get("required", False)
+        output_policies = output_def.get("policies")
+        output_implicit = output_def.get("implicit")
+        output_metadata = output_def.get("metadata")
 
         lines.append("@stimela_output(")
         lines.append(f'    dtype="{output_dtype}",')
@@ -228,7 +320,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
             if "\n" in output_info_split:
                 # Multi-line info
                 info_lines = output_info_split.split("\n")
-                info_lines_escaped = [line.replace('"', '\\"') for line in info_lines]
+                info_lines_escaped = [line.translate(_ESCAPE_TABLE) for line in info_lines]
                 if len(info_lines_escaped) > 1:
                     lines.append(f'    info="{info_lines_escaped[0]} "')
                     for line in info_lines_escaped[1:-1]:
@@ -245,7 +337,7 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
                         lines.append(f'    info="{info_lines_escaped[0]}",')
             else:
                 # Single line info
-                output_info_escaped = output_info_split.replace('"', '\\"')
+                output_info_escaped = output_info_split.translate(_ESCAPE_TABLE)
                 if output_trailing_comment:
                     lines.append(f'    info="{output_info_escaped}",{output_trailing_comment}')
                 else:
@@ -256,29 +348,24 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         if output_required:
             lines.append(f"    required={output_required},")
 
-        if output_def.get("policies", None):
-            lines.append(f"    policies={output_def.get('policies')},")
+        if output_policies:
+            lines.append(f"    policies={output_policies},")
 
-        if output_def.get("implicit", None):
-            implicit_value_raw = output_def.get("implicit")
+        if output_implicit:
             # Extract trailing comment from implicit value
-            implicit_value, implicit_trailing_comment = extract_trailing_comment(implicit_value_raw)
+            implicit_value, implicit_trailing_comment = extract_trailing_comment(output_implicit)
             if implicit_trailing_comment:
                 lines.append(f'    implicit="{implicit_value}",{implicit_trailing_comment}')
             else:
                 lines.append(f'    implicit="{implicit_value}",')
 
-        if "must_exist" in output_def:
-            lines.append(f"    must_exist={output_def.get('must_exist')},")
-
-        if "mkdir" in output_def:
-            lines.append(f"    mkdir={output_def.get('mkdir')},")
-
-        if "path_policies" in output_def:
-            lines.append(f"    path_policies={output_def.get('path_policies')},")
+        # Explicitly-set fields are emitted even when falsy
+        for field in ("must_exist", "mkdir", "path_policies"):
+            if field in output_def:
+                lines.append(f"    {field}={output_def[field]},")
 
-        if output_def.get("metadata"):
-            lines.append(f"    metadata={output_def['metadata']},")
+        if output_metadata:
+            lines.append(f"    metadata={output_metadata},")
 
         lines.append(")")
 
@@ -358,16 +445,18 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         lines.append('    """')
 
     # Function body - generate the implementation
-    lines.extend(generate_function_body(cab_def, inputs, explicit_outputs))
+    # Joined here so the body is one chunk of the final join rather than one entry per line
+    lines.append("\n".join(generate_function_body(cab_def, inputs, explicit_outputs)))
 
     function_code = "\n".join(lines)
 
-    # 1. Prepare the Linter command (Check + Fix)
-    # Note: We use --stdin-filename to give Ruff context, and - to read/write to stdout
-    check_cmd = ["ruff", "check", "--fix", "--stdin-filename", "generated.py", "-"]
-
-    # 2. Prepare the Formatter command
-    format_cmd = ["ruff", "format", "--stdin-filename", "generated.py", "-"]
+    # Lint (check + fix) then format. With an output file ruff works on the file
+    # in place, so the code is never piped back through Python; otherwise it
+    # reads from stdin and writes to stdout. --stdin-filename gives Ruff context.
+    # The file path is absolute because ruff may run from the config file's directory.
+    target = [str(Path(output_file).resolve())] if output_file else ["--stdin-filename", "generated.py", "-"]
+    check_cmd = ["ruff", "check", "--fix", *target]
+    format_cmd = ["ruff", "format", *target]
 
     # Run ruff from the config file's directory so it infers first-party imports correctly
     ruff_cwd = None
@@ -376,6 +465,27 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         format_cmd.extend(["--config", str(config_file)])
         ruff_cwd = str(Path(config_file).resolve().parent)
 
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(function_code)
+        # ruff check has already applied its fixes when it exits non-zero on an unfixable
+        # violation, so always format afterwards. In path mode diagnostics go to stdout.
+        lint_result = subprocess.run(check_cmd, capture_output=True, text=True, check=False, cwd=ruff_cwd)
+        if lint_result.returncode != 0:
+            warnings.warn(
+                "ruff check reported violations it could not fix. Error details:\n"
+                + lint_result.stdout
+                + lint_result.stderr
+            )
+        try:
+            subprocess.run(format_cmd, capture_output=True, text=True, check=True, cwd=ruff_cwd)
+        except subprocess.CalledProcessError as e:
+            warnings.warn(
+                "Code formatting with ruff failed; leaving code unformatted. Error details:\n" + e.stdout + e.stderr
+            )
+        print(f"Generated function written to: {output_file}")
+        return
+
     try:
         # First Pass: Lint and Fix
         lint_result = subprocess.run(
@@ -403,10 +513,4 @@ def generate_function(cab_file: Path, output_file: Path, config_file: Path | Non
         warnings.warn("Code formatting with ruff failed; using unformatted code. Error details:\n" + e.stderr)
         formatted_code = function_code  # Fallback to unformatted code
 
-    if output_file:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w") as f:
-            f.write(formatted_code)
-        print(f"Generated function written to: {output_file}")
-    else:
-        print(formatted_code)
+    print(formatted_code)
@@ -215,7 +215,8 @@ def generate_schemas(
         TunableTypeError: If any tunable parameter has an unsupported type.
         RuntimeError: If module paths are invalid or yield no files.
     """
-    modlist: list[Path] = []
+    # Overlapping patterns yield each file once
+    modset: set[Path] = set()
     for modpath in module:
         modpath = Path(modpath)
         if "*" in str(modpath):
@@ -224,11 +225,12 @@ def generate_schemas(
             matches = [f for f in base_path.glob(pattern) if f.is_file() and not f.name.startswith("__")]
             if not matches:
                 raise RuntimeError(f"No modules found matching {modpath}")
-            modlist.extend(matches)
+            modset.update(matches)
         else:
             if not modpath.is_file():
                 raise RuntimeError(f"No module file found at {modpath}")
-            modlist.append(modpath)
+            modset.add(modpath)
+    modlist = sorted(modset)
 
     for mod in modlist:
         print(f"Loading file: {mod}")
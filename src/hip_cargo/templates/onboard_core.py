@@ -1,7 +1,6 @@
-def onboard():
-    """Print setup instructions for CI/CD, PyPI publishing, and GitHub configuration."""
-    print(
-        """
+import sys
+
+_ONBOARD_TEXT = """
 ================================================================================
   <PROJECT_NAME> — Setup Instructions
 ================================================================================
@@ -177,5 +176,10 @@ with type hints and a @stimela_cab decorator, and Stimela cab definitions
 will be auto-generated from your CLI definitions via pre-commit hooks.
 
 For more details, see: https://github.com/landmanbester/hip-cargo#readme
+
 """
-    )
+
+
+def onboard():
+    """Print setup instructions for CI/CD, PyPI publishing, and GitHub configuration."""
+    sys.stdout.write(_ONBOARD_TEXT)
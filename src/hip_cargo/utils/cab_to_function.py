@@ -1,11 +1,16 @@
 """Generate Python function signatures from Stimela cab definitions."""
 
+import functools
+import re
 from typing import Any, Optional
 
 from hip_cargo.utils.types import LIST_DTYPE_PARSERS
 
 # Custom Stimela types that need NewType declarations
-CUSTOM_STIMELA_TYPES = {"File", "Directory", "MS", "URI"}
+CUSTOM_STIMELA_TYPES = frozenset({"File", "Directory", "MS", "URI"})
+
+# Any custom type name anywhere in a dtype string (substring match, e.g. List[File])
+_CUSTOM_TYPE_RE = re.compile("|".join(sorted(CUSTOM_STIMELA_TYPES)))
 
 # Mapping from stimela dtype to ListType NewType name
 STIMELA_DTYPE_TO_LIST_TYPE = {
@@ -21,6 +26,53 @@ LIST_TYPE_PARSERS = {
     "ListStr": "parse_list_str",
 }
 
+# Dtypes whose Python type hint maps back to the same dtype without an override
+_SCALAR_DTYPES = frozenset({"str", "int", "float", "bool"})
+
+# Mapping from scalar Stimela dtypes to Python types (anything else maps to str)
+_STIMELA_TO_PY_TYPE = {
+    "str": "str",
+    "int": "int",
+    "float": "float",
+    "bool": "bool",
+    "URL": "str",
+}
+
+# Dtypes whose string defaults are coerced to numeric literals
+_NUMERIC_DTYPES = frozenset({"int", "float"})
+
+# Decimal or scientific-notation number, as accepted by float() (no inf/nan)
+_NUMERIC_RE = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+
+# Param definitions using only these keys may take the signature fast path
+_FAST_PATH_KEYS = frozenset({"dtype", "info", "default", "required"})
+
+# Rendered signature for the fast path in _build_parameter_signature
+_FAST_PATH_TEMPLATE = (
+    "    {name}: Annotated[\n"
+    "        {py_type},\n"
+    "        typer.Option(\n"
+    '            help="{help}",\n'
+    "        ),\n"
+    "    ] = {default},"
+)
+
+# Param fields handled by typer.Option or inferred from type hints
+_HANDLED_FIELDS = frozenset(
+    {
+        "info",  # becomes help= in typer.Option
+        "dtype",  # inferred from type hint (unless overridden)
+        "required",  # handled by default=... in typer.Option
+        "default",  # handled by function default value
+        "choices",  # handled by Literal type
+        "metadata",  # split: rich_help_panel → typer.Option, rest → StimelaMeta(metadata=...)
+        "policies",  # only non-standard policies are kept (see _STANDARD_POLICIES)
+    }
+)
+
+# Policies that can be inferred: positional (from required), repeat (from List)
+_STANDARD_POLICIES = frozenset({"positional", "repeat"})
+
 # Mapping from ListType name to stimela dtype
 CUSTOM_LIST_TYPES = {
     "ListInt": "List[int]",
@@ -29,6 +81,7 @@ CUSTOM_LIST_TYPES = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_trailing_comment(text: str) -> tuple[str, str]:
     """
     Extract trailing comment from text (e.g., "  # noqa: E501").
@@ -43,16 +96,14 @@ def extract_trailing_comment(text: str) -> tuple[str, str]:
     if not text:
         return text, ""
 
-    # Look for "  #" pattern (double space before comment)
-    if "  #" in text:
-        comment_idx = text.rfind("  #")
-        comment = text[comment_idx:]
-        text_without = text[:comment_idx].rstrip()
-        return text_without, comment
-
-    return text, ""
+    # Look for "  #" pattern (double space before comment) in a single scan
+    comment_idx = text.rfind("  #")
+    if comment_idx == -1:
+        return text, ""
+    return text[:comment_idx].rstrip(), text[comment_idx:]
 
 
+@functools.cache
 def is_custom_type(dtype: str) -> bool:
     """
     Check if a dtype is a custom Stimela type.
@@ -63,11 +114,8 @@ def is_custom_type(dtype: str) -> bool:
     Returns:
         True if it's a custom type (File, MS, Directory, URI)
     """
-    # Check base type and nested types
-    for custom_type in CUSTOM_STIMELA_TYPES:
-        if custom_type in dtype:
-            return True
-    return False
+    # Exact match is the common case; otherwise look for nested types
+    return dtype in CUSTOM_STIMELA_TYPES or _CUSTOM_TYPE_RE.search(dtype) is not None
 
 
 def extract_custom_types(dct: dict[str, Any]) -> set[str]:
@@ -82,17 +130,35 @@ def extract_custom_types(dct: dict[str, Any]) -> set[str]:
     """
     custom_types = set()
     for param_def in dct.values():
-        dtype = param_def.get("dtype", "str")
-        for custom_type in CUSTOM_STIMELA_TYPES:
-            if custom_type in str(dtype):
-                custom_types.add(custom_type)
+        custom_types.update(_CUSTOM_TYPE_RE.findall(str(param_def.get("dtype", "str"))))
+        if len(custom_types) == len(CUSTOM_STIMELA_TYPES):
+            break
     return custom_types
 
 
+def unwrap_optional_dtype(dtype: str) -> tuple[str, bool]:
+    """
+    Strip an outer ``Optional[...]`` from a Stimela dtype.
+
+    Args:
+        dtype: Stimela dtype (e.g., 'Optional[List[int]]')
+
+    Returns:
+        Tuple of (inner dtype, whether it was wrapped in Optional)
+    """
+    if dtype.startswith("Optional[") and dtype.endswith("]"):
+        return dtype[9:-1], True
+    return dtype, False
+
+
+@functools.lru_cache(maxsize=512)
 def stimela_dtype_to_python_type(dtype: str, preserve_custom: bool = True) -> str:
     """
     Convert Stimela dtype to Python type hint string.
 
+    Cached: cabs draw their dtypes from a small fixed vocabulary, so the same
+    strings (and the nested List/Tuple element types) recur constantly.
+
     Args:
         dtype: Stimela dtype (e.g., 'File', 'int', 'List[str]')
         preserve_custom: If True, keep custom types (File, MS, etc.) as-is
@@ -101,8 +167,8 @@ def stimela_dtype_to_python_type(dtype: str, preserve_custom: bool = True) -> st
         Python type hint as string
     """
     # Handle Optional types - unwrap and add | None
-    if dtype.startswith("Optional[") and dtype.endswith("]"):
-        inner = dtype[9:-1]
+    inner, is_optional = unwrap_optional_dtype(dtype)
+    if is_optional:
         inner_py = stimela_dtype_to_python_type(inner, preserve_custom)
         return f"{inner_py} | None"
 
@@ -119,15 +185,6 @@ def stimela_dtype_to_python_type(dtype: str, preserve_custom: bool = True) -> st
         inner_parts = [stimela_dtype_to_python_type(t.strip(), preserve_custom) for t in inner_types.split(",")]
         return f"tuple[{', '.join(inner_parts)}]"
 
-    # Map Stimela types to Python types
-    type_map = {
-        "str": "str",
-        "int": "int",
-        "float": "float",
-        "bool": "bool",
-        "URL": "str",
-    }
-
     # For custom types, preserve them if requested
     if preserve_custom and dtype in CUSTOM_STIMELA_TYPES:
         return dtype
@@ -136,7 +193,7 @@ def stimela_dtype_to_python_type(dtype: str, preserve_custom: bool = True) -> st
     if dtype in CUSTOM_STIMELA_TYPES:
         return "Path"
 
-    return type_map.get(dtype, "str")
+    return _STIMELA_TO_PY_TYPE.get(dtype, "str")
 
 
 def extract_info_string(info: Any) -> str:
@@ -151,15 +208,17 @@ def extract_info_string(info: Any) -> str:
     """
     if isinstance(info, str):
         return info.strip()
-    elif isinstance(info, (list, dict)):
-        # Sometimes info is multi-line stored as list or dict
-        if isinstance(info, list):
-            return " ".join(str(line).strip() for line in info)
-        else:
-            # Extract the actual info from dict structure
-            return str(info).strip()
-    else:
-        return ""
+    # Sometimes info is multi-line stored as list or dict
+    if isinstance(info, list):
+        return " ".join(map(str.strip, map(str, info)))
+    if isinstance(info, dict):
+        # Extract the actual info from dict structure
+        return str(info).strip()
+    return ""
+
+
+# The single space after a sentence-ending period
+_SENTENCE_BREAK_RE = re.compile(r"(?<=\.) ")
 
 
 def split_info_at_periods(info: str) -> str:
@@ -176,34 +235,26 @@ def split_info_at_periods(info: str) -> str:
     """
     if not info:
         return info
+    # Single-sentence help (the common case) only needs the strip
+    if ". " not in info:
+        return info.strip()
 
     # Split at ". " (period followed by space) to preserve sentence boundaries
     # This avoids splitting on periods in numbers like "1.5" or file extensions
-    sentences = []
-    current = ""
-    i = 0
-
-    while i < len(info):
-        current += info[i]
-        # Check if we hit a period followed by space (or end of string)
-        if info[i] == "." and (i + 1 >= len(info) or info[i + 1] == " "):
-            # Found end of sentence
-            sentence = current.strip()
-            if sentence:
-                sentences.append(sentence)
-            current = ""
-            # Skip the space after the period
-            if i + 1 < len(info) and info[i + 1] == " ":
-                i += 1
-        i += 1
-
-    # Add any remaining text
-    remaining = current.strip()
-    if remaining:
-        sentences.append(remaining)
-
-    # Join with newlines
-    return "\n".join(sentences)
+    return "\n".join(sentence for part in _SENTENCE_BREAK_RE.split(info) if (sentence := part.strip()))
+
+
+# Indent strings by nesting level; generated cabs never nest anywhere near this deep
+_INDENTS = tuple("    " * level for level in range(16))
+
+
+def _format_scalar(value: Any) -> str:
+    """Format a non-container value: strings are double-quoted, everything else is str().
+
+    ``str()`` already yields ``True``/``False``/``None`` and numeric literals, so
+    no per-type branches are needed.
+    """
+    return f'"{value}"' if isinstance(value, str) else str(value)
 
 
 def _format_value_multiline(value: Any, indent_level: int) -> str:
@@ -211,27 +262,12 @@ def _format_value_multiline(value: Any, indent_level: int) -> str:
     if isinstance(value, dict):
         return format_dict_multiline(value, indent_level)
     if isinstance(value, list):
-        item_strs = []
-        for item in value:
-            if isinstance(item, dict):
-                item_repr = format_dict_multiline(item, indent_level + 1)
-            elif isinstance(item, bool):
-                item_repr = "True" if item else "False"
-            elif isinstance(item, str):
-                item_repr = f'"{item}"'
-            elif item is None:
-                item_repr = "None"
-            else:
-                item_repr = str(item)
-            item_strs.append(item_repr)
+        item_strs = [
+            format_dict_multiline(item, indent_level + 1) if isinstance(item, dict) else _format_scalar(item)
+            for item in value
+        ]
         return "[" + ", ".join(item_strs) + "]"
-    if isinstance(value, bool):
-        return "True" if value else "False"
-    if isinstance(value, str):
-        return f'"{value}"'
-    if value is None:
-        return "None"
-    return str(value)
+    return _format_scalar(value)
 
 
 def format_dict_multiline(d: dict[str, Any], indent_level: int = 0) -> str:
@@ -250,8 +286,8 @@ def format_dict_multiline(d: dict[str, Any], indent_level: int = 0) -> str:
     if not d:
         return "{}"
 
-    indent = "    " * indent_level
-    next_indent = "    " * (indent_level + 1)
+    indent = _INDENTS[indent_level]
+    next_indent = _INDENTS[indent_level + 1]
 
     lines = ["{"]
     for key, value in d.items():
@@ -281,8 +317,8 @@ def format_stimela_meta_call(meta: dict[str, Any], indent_level: int = 0) -> str
     if not meta:
         return "StimelaMeta()"
 
-    indent = "    " * indent_level
-    next_indent = "    " * (indent_level + 1)
+    indent = _INDENTS[indent_level]
+    next_indent = _INDENTS[indent_level + 1]
 
     lines = ["StimelaMeta("]
     for key, value in meta.items():
@@ -292,13 +328,125 @@ def format_stimela_meta_call(meta: dict[str, Any], indent_level: int = 0) -> str
     return "\n".join(lines)
 
 
+# Backslashes, quotes and raw control characters would otherwise break out of
+# the generated string literal. translate() maps each character exactly once,
+# so a backslash introduced by one escape is never re-escaped by another.
+_HELP_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
 def _escape_help(text: str) -> str:
-    """Escape a help/info fragment for emission inside a double-quoted literal.
+    """Escape a help/info fragment for emission inside a double-quoted literal."""
+    return text.translate(_HELP_ESCAPES)
+
 
-    Backslashes must be escaped before quotes, and raw control characters
-    would otherwise break out of the generated string literal.
+def _format_default(val: Any, dtype: str) -> str:
     """
-    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+    Format a default value as Python source for a generated signature.
+
+    Args:
+        val: Default value from the cab definition
+        dtype: Stimela dtype of the parameter (numeric strings are coerced for int/float)
+
+    Returns:
+        Python literal string
+    """
+    # Handle boolean first (before int check, since bool is subclass of int)
+    if isinstance(val, bool):
+        return "True" if val else "False"
+    elif val is None:
+        return "None"
+    elif isinstance(val, (int, float)):
+        return str(val)
+    elif isinstance(val, str):
+        # Check if this is a numeric string and dtype is numeric
+        # Numeric strings for numeric dtypes become literals (handles scientific
+        # notation); anything else falls through without raising
+        if dtype in _NUMERIC_DTYPES and _NUMERIC_RE.fullmatch(val):
+            float_val = float(val)
+            return str(int(float_val)) if dtype == "int" else str(float_val)
+        # Regular string — repr escapes quotes/backslashes/newlines safely
+        return repr(val)
+    elif isinstance(val, list):
+        return "[" + ", ".join(_format_default(v, dtype) for v in val) + "]"
+    else:
+        return str(val)
+
+
+# As _HELP_ESCAPES, but each sentence break ("\n" from split_info_at_periods)
+# closes one quoted help fragment and opens the next on a continuation line
+_HELP_FRAGMENT_ESCAPES = {**_HELP_ESCAPES, ord("\n"): ' "\n                 "'}
+
+
+def _format_typer_option(
+    required: bool,
+    parser_str: Optional[str],
+    info: str,
+    trailing_comment: str,
+    rich_help_panel: Optional[str],
+) -> str:
+    """
+    Format the ``typer.Option(...)`` block of a generated parameter.
+
+    Args:
+        required: Whether the parameter is required (emits ``...`` as default)
+        parser_str: Name of the parser function, if any
+        info: Help text, already split into sentences on newlines
+        trailing_comment: Comment to append after the help text (may be empty)
+        rich_help_panel: Optional rich help panel name
+
+    Returns:
+        The block as a string, one argument per line with trailing commas
+    """
+    lines = ["        typer.Option("]
+    if required:
+        lines.append("            ...,")
+    if parser_str:
+        lines.append(f"            parser={parser_str},")
+
+    # Help text: one quoted fragment per sentence, implicitly concatenated.
+    # Every fragment but the last gets a trailing space for proper concatenation.
+    help_text = info.translate(_HELP_FRAGMENT_ESCAPES)
+    lines.append(f'            help="{help_text}",{trailing_comment}')
+
+    if rich_help_panel:
+        lines.append(f'            rich_help_panel="{rich_help_panel}",')
+
+    lines.append("        ),")
+    return "\n".join(lines)
+
+
+def _freeze_param_value(value: Any) -> Any:
+    """Convert a cab value to a hashable, type-tagged form for use as a cache key.
+
+    Every node carries its type so that values which compare equal but render
+    differently (``1``, ``1.0`` and ``True``; lists and tuples) get distinct keys.
+    Floats are keyed on their repr, since ``0.0 == -0.0`` but they render differently.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze_param_value(k), _freeze_param_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list if isinstance(value, list) else tuple, tuple(_freeze_param_value(v) for v in value))
+    if type(value) is float:
+        return (float, repr(value))
+    return (type(value), value)
+
+
+def _thaw_param_value(frozen: Any) -> Any:
+    """Invert :func:`_freeze_param_value`."""
+    kind, payload = frozen
+    if kind is dict:
+        return {_thaw_param_value(k): _thaw_param_value(v) for k, v in payload}
+    if kind is list or kind is tuple:
+        return kind(_thaw_param_value(v) for v in payload)
+    if kind is float:
+        return float(payload)
+    return payload
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_parameter_signature(param_name: str, frozen_def: Any) -> str:
+    """Memoized :func:`_build_parameter_signature` keyed on a frozen param_def."""
+    return _build_parameter_signature(param_name, _thaw_param_value(frozen_def))
 
 
 def generate_parameter_signature(
@@ -307,6 +455,10 @@ def generate_parameter_signature(
     """
     Generate parameter signature for a single parameter using Annotated style.
 
+    Cabs within a package share many parameter definitions, so signatures are
+    cached on the parameter name and a frozen copy of ``param_def``. Definitions
+    holding unhashable values are rendered without caching.
+
     Args:
         param_name: Parameter name (will be sanitized)
         param_def: Parameter definition from cab
@@ -315,6 +467,16 @@ def generate_parameter_signature(
     Returns:
         Parameter signature string
     """
+    try:
+        frozen_def = _freeze_param_value(param_def)
+        hash(frozen_def)
+    except TypeError:
+        return _build_parameter_signature(param_name, param_def)
+    return _cached_parameter_signature(param_name, frozen_def)
+
+
+def _build_parameter_signature(param_name: str, param_def: dict[str, Any]) -> str:
+    """Render the signature for one parameter (see :func:`generate_parameter_signature`)."""
     # Sanitize parameter name (replace hyphens with underscores)
     py_param_name = param_name.replace("-", "_")
 
@@ -328,8 +490,7 @@ def generate_parameter_signature(
     # Check if this is a comma-separated list type (List[int], List[float], List[str])
     # These use dedicated ListType NewTypes with parser functions
     # Unwrap Optional[...] for the lookup since Optional[List[int]] should use ListInt too
-    is_optional = dtype.startswith("Optional[") and dtype.endswith("]")
-    lookup_dtype = dtype[9:-1] if is_optional else dtype
+    lookup_dtype, is_optional = unwrap_optional_dtype(dtype)
     list_type_name = STIMELA_DTYPE_TO_LIST_TYPE.get(lookup_dtype)
     if list_type_name:
         py_type = f"{list_type_name} | None" if is_optional else list_type_name
@@ -347,6 +508,24 @@ def generate_parameter_signature(
     # Split info at periods to avoid long lines (after all modifications)
     info = split_info_at_periods(info)
 
+    # Fast path for the most common shape: an optional scalar with a default and
+    # a single-sentence help. Nothing else in the definition means no parser,
+    # Literal, dtype override or StimelaMeta can be needed.
+    if (
+        not required
+        and default is not None
+        and dtype in _SCALAR_DTYPES
+        and param_def.keys() <= _FAST_PATH_KEYS
+        and not trailing_comment
+        and "\n" not in info
+    ):
+        return _FAST_PATH_TEMPLATE.format(
+            name=py_param_name,
+            py_type=dtype,
+            help=_escape_help(info),
+            default=_format_default(default, dtype),
+        )
+
     # Check if this is a custom type that needs a parser
     needs_parser = is_custom_type(dtype)
 
@@ -359,45 +538,16 @@ def generate_parameter_signature(
         py_type = f"Literal[{choices_formatted}]"
         needs_parser = False  # Literal types don't need parser
 
-    # Format default value for Python code
-    def format_default(val):
-        # Handle boolean first (before int check, since bool is subclass of int)
-        if isinstance(val, bool):
-            return "True" if val else "False"
-        elif val is None:
-            return "None"
-        elif isinstance(val, (int, float)):
-            return str(val)
-        elif isinstance(val, str):
-            # Check if this is a numeric string and dtype is numeric
-            if dtype in ["int", "float"]:
-                try:
-                    # Try to parse as float (handles scientific notation)
-                    float_val = float(val)
-                    # If dtype is int, convert to int
-                    if dtype == "int":
-                        return str(int(float_val))
-                    else:
-                        return str(float_val)
-                except (ValueError, TypeError):
-                    # Not a valid number, treat as string
-                    pass
-            # Regular string — repr escapes quotes/backslashes/newlines safely
-            return repr(val)
-        elif isinstance(val, list):
-            return "[" + ", ".join(format_default(v) for v in val) + "]"
-        else:
-            return str(val)
-
-    # Check if info contains newlines (for proper help text formatting)
-    has_newlines = "\n" in info
-
     # Build the Typer annotation (Annotated style)
     # ALWAYS use multi-line format with trailing commas to ensure ruff preserves the style
 
+    # Optional params without a default are annotated "X | None" (= None below)
+    emit_optional = not required and default is None and not uses_literal and not is_optional
+    annotated_type = f"{py_type} | None" if emit_optional else py_type
+
     lines_out = []
     lines_out.append(f"    {py_param_name}: Annotated[")
-    lines_out.append(f"        {py_type},")
+    lines_out.append(f"        {annotated_type},")
 
     # Determine parser: list types use their own parser, custom path types
     # use parse_upath so the CLI accepts local paths or remote URIs.
@@ -407,56 +557,10 @@ def generate_parameter_signature(
     elif needs_parser:
         parser_str = "parse_upath"
 
-    # Build typer.Option with arguments on separate lines
-    if required:
-        lines_out.append("        typer.Option(")
-        lines_out.append("            ...,")
-        if parser_str:
-            lines_out.append(f"            parser={parser_str},")
-    else:
-        lines_out.append("        typer.Option(")
-        if parser_str:
-            lines_out.append(f"            parser={parser_str},")
-
-    # Add help text (handle multi-line info)
-    if has_newlines:
-        # Split info by newlines and quote each sentence
-        info_lines = info.split("\n")
-        # Escape quotes in each line
-        info_lines_escaped = [_escape_help(line) for line in info_lines]
-
-        # First line starts with help=
-        # Add space at end of each line except the last for proper concatenation
-        if len(info_lines_escaped) > 1:
-            lines_out.append(f'            help="{info_lines_escaped[0]} "')
-            # Subsequent lines (except last) also need trailing space
-            for line in info_lines_escaped[1:-1]:
-                lines_out.append(f'                 "{line} "')
-            # Last line has no trailing space and ends with comma, plus optional comment
-            if trailing_comment:
-                lines_out.append(f'                 "{info_lines_escaped[-1]}",{trailing_comment}')
-            else:
-                lines_out.append(f'                 "{info_lines_escaped[-1]}",')
-        else:
-            if trailing_comment:
-                lines_out.append(f'            help="{info_lines_escaped[0]}",{trailing_comment}')
-            else:
-                lines_out.append(f'            help="{info_lines_escaped[0]}",')
-    else:
-        # Single-line help text
-        info_escaped = _escape_help(info)
-        if trailing_comment:
-            lines_out.append(f'            help="{info_escaped}",{trailing_comment}')
-        else:
-            lines_out.append(f'            help="{info_escaped}",')
-
-    # Add rich_help_panel if present in metadata
     param_metadata = param_def.get("metadata", {})
-    rich_help_panel = param_metadata.get("rich_help_panel")
-    if rich_help_panel:
-        lines_out.append(f'            rich_help_panel="{rich_help_panel}",')
-
-    lines_out.append("        ),")
+    lines_out.append(
+        _format_typer_option(required, parser_str, info, trailing_comment, param_metadata.get("rich_help_panel"))
+    )
 
     # Build stimela metadata dict for non-standard fields
     stimela_meta = {}
@@ -468,27 +572,14 @@ def generate_parameter_signature(
     if extra_metadata:
         stimela_meta["metadata"] = extra_metadata
 
-    # Fields that are handled by typer.Option or inferred from type hints
-    handled_fields = {
-        "info",  # becomes help= in typer.Option
-        "dtype",  # inferred from type hint (unless overridden)
-        "required",  # handled by default=... in typer.Option
-        "default",  # handled by function default value
-        "choices",  # handled by Literal type
-        "metadata",  # split above: rich_help_panel → typer.Option, rest → StimelaMeta(metadata=...)
-    }
-
     # Check if dtype needs explicit override (can't be inferred from type hint alone)
     # This happens when the type hint is generic (like str or Path) but dtype is specific (like File)
     # Skip for ListType NewTypes — their dtype is inferred from the type name
-    if dtype not in ["str", "int", "float", "bool"] and not list_type_name:
+    if dtype not in _SCALAR_DTYPES and not list_type_name:
         # Normalize comparison: strip Optional/None wrappers and lowercase generics
         normalized_py_type = py_type.replace(" | None", "").replace("list[", "List[").replace("tuple[", "Tuple[")
         normalized_py_type = normalized_py_type.replace("dict[", "Dict[")
-        normalized_dtype = dtype
-        if normalized_dtype.startswith("Optional[") and normalized_dtype.endswith("]"):
-            normalized_dtype = normalized_dtype[9:-1]
-        normalized_dtype = normalized_dtype.replace("list[", "List[").replace("tuple[", "Tuple[")
+        normalized_dtype = lookup_dtype.replace("list[", "List[").replace("tuple[", "Tuple[")
         normalized_dtype = normalized_dtype.replace("dict[", "Dict[")
 
         # Check if the actual dtype differs from what we'd infer from py_type
@@ -499,14 +590,13 @@ def generate_parameter_signature(
     # Check policies - only add if they contain non-standard fields
     if "policies" in param_def:
         policies_dict = param_def["policies"]
-        # Standard policies that can be inferred: positional (from required), repeat (from List)
-        non_standard_policies = {k: v for k, v in policies_dict.items() if k not in ["positional", "repeat"]}
+        non_standard_policies = {k: v for k, v in policies_dict.items() if k not in _STANDARD_POLICIES}
         if non_standard_policies:
             stimela_meta["policies"] = non_standard_policies
 
     # Add all other arbitrary fields from param_def
     for key, value in param_def.items():
-        if key not in handled_fields and key != "policies":
+        if key not in _HANDLED_FIELDS:
             stimela_meta[key] = value
 
     # If there are stimela metadata fields, emit a StimelaMeta(...) call
@@ -517,13 +607,10 @@ def generate_parameter_signature(
 
     # Add closing bracket and default if applicable
     if default is not None and not required:
-        default_val = format_default(default)
+        default_val = _format_default(default, dtype)
         lines_out.append(f"    ] = {default_val},")
     elif not required:
         # No default provided, use None for optional
-        if " | None" not in py_type and not uses_literal:
-            # Need to go back and fix the type
-            lines_out[1] = f"        {py_type} | None,"
         lines_out.append("    ] = None,")
     else:
         lines_out.append("    ],")
@@ -558,6 +645,12 @@ def generate_function_body(cab_def: dict[str, Any], inputs: dict[str, Any], outp
         lines.append("    if backend == 'native' or backend == 'auto':")
         lines.append("        try:")
 
+    # Python names for every input and output, computed once and reused by
+    # each dict(...) block and the core call below
+    input_py_names = [param_name.replace("-", "_") for param_name in inputs]
+    output_py_names = [output_name.replace("-", "_") for output_name in outputs]
+    py_names = input_py_names + output_py_names
+
     # Parse the command to get the import path
     command = cab_def.get("command", "")
     # Format is: module.path.function_name
@@ -569,36 +662,16 @@ def generate_function_body(cab_def: dict[str, Any], inputs: dict[str, Any], outp
     # The preflight calls .exists() on remote UPaths, which may raise ImportError
     # if the fsspec backend is missing. When has_image is True, it must live
     # INSIDE the try/except block so the container fallback can catch that.
-    if has_image:
-        lines.append(f"{indent}# Pre-flight must_exist for remote URIs before dispatching.")
-        lines.append(f"{indent}from hip_cargo.utils.runner import preflight_remote_must_exist  # noqa: E402")
-        lines.append(f"{indent}preflight_remote_must_exist(")
-        lines.append(f"{indent}    {func_name},")
-        lines.append(f"{indent}    dict(")
-        for param_name in inputs:
-            py_name = param_name.replace("-", "_")
-            lines.append(f"{indent}        {py_name}={py_name},")
-        for output_name in outputs:
-            py_name = output_name.replace("-", "_")
-            lines.append(f"{indent}        {py_name}={py_name},")
-        lines.append(f"{indent}    ),")
-        lines.append(f"{indent})")
-        lines.append("")
-    else:
-        lines.append("    # Pre-flight must_exist for remote URIs before dispatching.")
-        lines.append("    from hip_cargo.utils.runner import preflight_remote_must_exist  # noqa: E402")
-        lines.append("    preflight_remote_must_exist(")
-        lines.append(f"        {func_name},")
-        lines.append("        dict(")
-        for param_name in inputs:
-            py_name = param_name.replace("-", "_")
-            lines.append(f"            {py_name}={py_name},")
-        for output_name in outputs:
-            py_name = output_name.replace("-", "_")
-            lines.append(f"            {py_name}={py_name},")
-        lines.append("        ),")
-        lines.append("    )")
-        lines.append("")
+    lines.append(f"{indent}# Pre-flight must_exist for remote URIs before dispatching.")
+    lines.append(f"{indent}from hip_cargo.utils.runner import preflight_remote_must_exist  # noqa: E402")
+    lines.append(f"{indent}preflight_remote_must_exist(")
+    lines.append(f"{indent}    {func_name},")
+    lines.append(f"{indent}    dict(")
+    if py_names:
+        lines.append("\n".join([f"{indent}        {py_name}={py_name}," for py_name in py_names]))
+    lines.append(f"{indent}    ),")
+    lines.append(f"{indent})")
+    lines.append("")
 
     # Lazy import
     lines.append(f"{indent}# Lazy import the core implementation")
@@ -609,34 +682,12 @@ def generate_function_body(cab_def: dict[str, Any], inputs: dict[str, Any], outp
     lines.append(f"{indent}# Call the core function with all parameters")
     lines.append(f"{indent}{core_func_name}_core(")
 
-    # Separate required (positional) and optional (keyword) parameters
-    positional_params = []
-    keyword_params = []
-
-    # Add input parameters
-    for param_name, param_def in inputs.items():
-        py_param_name = param_name.replace("-", "_")
-        is_required = param_def.get("required", False)
-
-        if is_required:
-            positional_params.append(f"{indent}    {py_param_name},")
-        else:
-            keyword_params.append(f"{indent}    {py_param_name}={py_param_name},")
-
-    # Add output parameters (positional if they have positional policy, otherwise keyword)
-    for output_name, output_def in outputs.items():
-        py_output_name = output_name.replace("-", "_")
-        policies = output_def.get("policies", {})
-        is_positional = policies.get("positional", False)
-
-        if is_positional:
-            positional_params.append(f"{indent}    {py_output_name},")
-        else:
-            keyword_params.append(f"{indent}    {py_output_name}={py_output_name},")
-
-    # Combine: positional args first, then keyword args
-    all_params = positional_params + keyword_params
-    lines.extend(all_params)
+    # Required inputs and outputs with a positional policy are passed
+    # positionally (first), everything else by keyword
+    is_positional = [param_def.get("required", False) for param_def in inputs.values()]
+    is_positional += [output_def.get("policies", {}).get("positional", False) for output_def in outputs.values()]
+    lines.extend(f"{indent}    {name}," for name, positional in zip(py_names, is_positional) if positional)
+    lines.extend(f"{indent}    {name}={name}," for name, positional in zip(py_names, is_positional) if not positional)
     lines.append(f"{indent})")
 
     if has_image:
@@ -651,8 +702,7 @@ def generate_function_body(cab_def: dict[str, Any], inputs: dict[str, Any], outp
         lines.append("")
 
         # Derive distribution name from command: "pfb_imaging.core.grid.grid" → "pfb-imaging"
-        command = cab_def.get("command", "")
-        import_name = command.split(".")[0] if command else ""
+        import_name = command_parts[0]
         dist_name = import_name.replace("_", "-")
 
         lines.append(f'    image = get_container_image("{dist_name}")')
@@ -664,12 +714,8 @@ def generate_function_body(cab_def: dict[str, Any], inputs: dict[str, Any], outp
         lines.append("    run_in_container(")
         lines.append(f"        {func_name},")
         lines.append("        dict(")
-        for param_name in inputs:
-            py_name = param_name.replace("-", "_")
-            lines.append(f"            {py_name}={py_name},")
-        for output_name in outputs:
-            py_name = output_name.replace("-", "_")
-            lines.append(f"            {py_name}={py_name},")
+        if py_names:
+            lines.append("\n".join([f"            {py_name}={py_name}," for py_name in py_names]))
         lines.append("        ),")
         lines.append("        image=image,")
         lines.append("        backend=backend,")
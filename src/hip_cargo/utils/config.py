@@ -1,6 +1,7 @@
 """Read container image from installed package metadata."""
 
 import importlib
+import sys
 import types
 from pathlib import Path
 
@@ -44,25 +45,24 @@ def get_container_image(package_name: str, package_import_name: str | None = Non
         pkg = package_import_name
     else:
         pkg = package_name.replace("-", "_")
-    module_name = f"{pkg}._container_image"
-    try:
-        mod = importlib.import_module(module_name)
-        return getattr(mod, "CONTAINER_IMAGE", None)
-    except ModuleNotFoundError as exc:
-        if exc.name and module_name.startswith(exc.name):
-            # The package or its _container_image module is not installed
-            return None
-        raise
+    mod = _load_container_image_module(pkg)
+    if mod is None:
+        # The package or its _container_image module is not installed
+        return None
+    return getattr(mod, "CONTAINER_IMAGE", None)
 
 
 def _load_container_image_module(import_name: str) -> types.ModuleType | None:
     """Import ``<import_name>._container_image`` or return None if absent.
 
-    Mirrors the ModuleNotFoundError discrimination in get_container_image:
-    a missing package/module returns None, while an unrelated import failure
-    inside the module propagates.
+    Only a missing package/module returns None; an unrelated import failure
+    inside the module propagates. Already-imported modules are returned
+    straight from ``sys.modules`` without going through the import machinery.
     """
     module_name = f"{import_name}._container_image"
+    mod = sys.modules.get(module_name)
+    if mod is not None:
+        return mod
     try:
         return importlib.import_module(module_name)
     except ModuleNotFoundError as exc:
@@ -1,6 +1,102 @@
 """Decorators for marking functions as Stimela cabs."""
 
-from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Optional
+
+
+class _DictAccess:
+    """Read-only ``dict``-style access for metadata that used to be a plain dict.
+
+    Code written against the old dict form (``cfg["name"]``, ``out.get("dtype")``,
+    ``dict(cfg)``) keeps working on the dataclass records.
+    """
+
+    __slots__ = ()
+
+    _dict_keys: ClassVar[tuple[str, ...]] = ()
+
+    def keys(self) -> list[str]:
+        return list(self._dict_keys)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._dict_keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@dataclass(frozen=True, slots=True)
+class StimelaCabConfig(_DictAccess):
+    """Cab-level metadata attached to a function as ``__stimela_cab_config__``.
+
+    Attributes:
+        name: Name of the cab.
+        info: Description of what the cab does.
+        policies: Cab-level policies.
+        extra: Additional cab metadata passed as keyword arguments.
+    """
+
+    name: str
+    info: str
+    policies: dict[str, Any] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    _dict_keys: ClassVar[tuple[str, ...]] = ("name", "info", "policies")
+
+    def keys(self) -> list[str]:
+        # Extra kwargs were top-level keys of the old dict
+        return [*self._dict_keys, *self.extra]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._dict_keys:
+            return getattr(self, key)
+        return self.extra[key]
+
+
+@dataclass(frozen=True, slots=True)
+class StimelaOutput(_DictAccess):
+    """One output definition, appended to a function's ``__stimela_outputs__``.
+
+    Field semantics match the :func:`stimela_output` arguments. ``py_name`` is
+    the Python parameter name (hyphens → underscores), computed once here
+    rather than on every runner lookup.
+    """
+
+    name: str
+    dtype: str
+    info: str = ""
+    required: bool = False
+    implicit: bool | str = False
+    policies: dict[str, Any] = field(default_factory=dict)
+    must_exist: bool = False
+    mkdir: bool = False
+    path_policies: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    py_name: str = field(init=False, repr=False, compare=False)
+
+    _dict_keys: ClassVar[tuple[str, ...]] = (
+        "name",
+        "dtype",
+        "info",
+        "required",
+        "implicit",
+        "policies",
+        "must_exist",
+        "mkdir",
+        "path_policies",
+        "metadata",
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "py_name", self.name.replace("-", "_"))
 
 
 def stimela_cab(
@@ -21,12 +117,7 @@ def stimela_cab(
 
     def decorator(func: Callable) -> Callable:
         # Store metadata on the function object
-        func.__stimela_cab_config__ = {
-            "name": name,
-            "info": info,
-            "policies": policies or {},
-            **kwargs,
-        }
+        func.__stimela_cab_config__ = StimelaCabConfig(name, info, policies or {}, kwargs)
         return func
 
     return decorator
@@ -69,18 +160,18 @@ def stimela_output(
 
         # Append this output definition
         func.__stimela_outputs__.append(
-            {
-                "name": name,
-                "dtype": dtype,
-                "info": info,
-                "required": required,
-                "implicit": implicit,
-                "policies": policies or {},
-                "must_exist": must_exist,
-                "mkdir": mkdir,
-                "path_policies": path_policies or {},
-                "metadata": metadata or {},
-            }
+            StimelaOutput(
+                name=name,
+                dtype=dtype,
+                info=info,
+                required=required,
+                implicit=implicit,
+                policies=policies or {},
+                must_exist=must_exist,
+                mkdir=mkdir,
+                path_policies=path_policies or {},
+                metadata=metadata or {},
+            )
         )
 
         return func
@@ -1,7 +1,9 @@
 """Function introspection for extracting cab information."""
 
 import ast
+import functools
 import re
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, NewType
 
@@ -33,6 +35,17 @@ def _normalize_list_default(dtype: str, default: Any) -> Any:
     return parser(default)
 
 
+def _normalize_slice(slice_items: Any) -> Sequence[cst.SubscriptElement]:
+    """Return a subscript's elements as a sequence.
+
+    LibCST represents the slice as a tuple or list of ``SubscriptElement``;
+    a bare element is wrapped so callers can always iterate and index.
+    """
+    if isinstance(slice_items, (tuple, list)):
+        return slice_items
+    return [slice_items]
+
+
 def unwrap_optional_libcst(annotation_node: cst.CSTNode) -> cst.CSTNode:
     """
     Unwrap Optional[...] or Union[..., None] wrappers from annotation.
@@ -56,14 +69,7 @@ def unwrap_optional_libcst(annotation_node: cst.CSTNode) -> cst.CSTNode:
     if base_name in ("Optional", "Union"):
         # Extract the first non-None type
         # For Union[X, None] or Optional[X], return X
-        slice_items = annotation_node.slice
-        # LibCST may represent the slice as a single element, a tuple, or a list
-        if isinstance(slice_items, tuple):
-            slice_items = list(slice_items)
-        elif not isinstance(slice_items, list):
-            slice_items = [slice_items]
-
-        for element in slice_items:
+        for element in _normalize_slice(annotation_node.slice):
             node = element.slice.value
             # Skip None
             if isinstance(node, cst.Name) and node.value == "None":
@@ -99,15 +105,7 @@ def parse_annotated_libcst(annotation_node: cst.CSTNode) -> tuple[cst.CSTNode, l
         raise ValueError("Expected Annotated type")
 
     # Extract slice elements [dtype, metadata1, metadata2, ...]
-    # LibCST represents subscripts as a tuple or list of SubscriptElement
-    slice_elements = unwrapped_node.slice
-
-    # Convert to list if it's a tuple
-    if isinstance(slice_elements, tuple):
-        slice_elements = list(slice_elements)
-    elif not isinstance(slice_elements, list):
-        # Single element case - convert to list
-        slice_elements = [slice_elements]
+    slice_elements = _normalize_slice(unwrapped_node.slice)
 
     if len(slice_elements) < 2:
         raise ValueError("Annotated requires at least 2 arguments")
@@ -120,23 +118,19 @@ def parse_annotated_libcst(annotation_node: cst.CSTNode) -> tuple[cst.CSTNode, l
     return dtype_node, metadata_nodes
 
 
-def extract_typer_metadata_libcst(metadata_nodes: list[cst.CSTNode]) -> dict[str, Any]:
+def _find_typer_call(metadata_nodes: list[cst.CSTNode]) -> cst.Call:
     """
-    Extract metadata from typer.Option(...) or typer.Argument(...) call.
-
-    Searches through metadata items to find a typer call and extracts its arguments.
+    Find the typer.Option(...) or typer.Argument(...) call among Annotated metadata.
 
     Args:
         metadata_nodes: List of metadata CST nodes from Annotated
 
     Returns:
-        Dict with keys from the typer call (help, default, etc.)
+        The typer call node
 
     Raises:
         ValueError: If no typer call found
     """
-    # Find the typer.Option or typer.Argument call
-    typer_call = None
     for node in metadata_nodes:
         if isinstance(node, cst.Call):
             # Check if it's a typer call (typer.Option, typer.Argument, etc.)
@@ -144,36 +138,53 @@ def extract_typer_metadata_libcst(metadata_nodes: list[cst.CSTNode]) -> dict[str
             if isinstance(func, cst.Attribute):
                 # typer.Option or typer.Argument
                 if isinstance(func.value, cst.Name) and func.value.value == "typer":
-                    typer_call = node
-                    break
+                    return node
             elif isinstance(func, cst.Name):
                 # Direct call like Option(...) - assume it's from typer
-                typer_call = node
-                break
+                return node
 
-    if typer_call is None:
-        raise ValueError("No typer.Option() or typer.Argument() call found in metadata")
+    raise ValueError("No typer.Option() or typer.Argument() call found in metadata")
 
-    # Extract both positional and keyword arguments using get_cst_value
-    metadata = {}
 
-    # First positional argument is typically the default value
-    positional_args = [arg for arg in typer_call.args if arg.keyword is None]
-    if positional_args:
-        # Use get_cst_value to handle Ellipsis, None, literals, etc.
-        metadata["default"] = get_cst_value(positional_args[0].value)
+def _typer_call_metadata(typer_call: cst.Call) -> dict[str, Any]:
+    """Extract the arguments of a typer call (see :func:`extract_typer_metadata_libcst`)."""
+    metadata = {}
 
-    # Extract keyword arguments
+    # One pass: the first positional argument is typically the default value,
+    # keyword arguments map by name. Python puts positionals first, so an
+    # explicit default= keyword still wins.
+    seen_positional = False
     for arg in typer_call.args:
-        if arg.keyword is not None:
-            key = arg.keyword.value
+        if arg.keyword is None:
+            if not seen_positional:
+                # Use get_cst_value to handle Ellipsis, None, literals, etc.
+                metadata["default"] = get_cst_value(arg.value)
+                seen_positional = True
+        else:
             # Use get_cst_value to handle complex values (lists, dicts, etc.)
-            value = get_cst_value(arg.value)
-            metadata[key] = value
+            metadata[arg.keyword.value] = get_cst_value(arg.value)
 
     return metadata
 
 
+def extract_typer_metadata_libcst(metadata_nodes: list[cst.CSTNode]) -> dict[str, Any]:
+    """
+    Extract metadata from typer.Option(...) or typer.Argument(...) call.
+
+    Searches through metadata items to find a typer call and extracts its arguments.
+
+    Args:
+        metadata_nodes: List of metadata CST nodes from Annotated
+
+    Returns:
+        Dict with keys from the typer call (help, default, etc.)
+
+    Raises:
+        ValueError: If no typer call found
+    """
+    return _typer_call_metadata(_find_typer_call(metadata_nodes))
+
+
 def extract_stimela_metadata_libcst(metadata_nodes: list[cst.CSTNode]) -> dict[str, Any]:
     """
     Extract custom Stimela metadata from Annotated metadata items.
@@ -218,6 +229,28 @@ def extract_stimela_metadata_libcst(metadata_nodes: list[cst.CSTNode]) -> dict[s
     return {}
 
 
+def _literal_choices(dtype_node: cst.BaseExpression) -> tuple[Any, ...] | None:
+    """Return the values of a top-level ``Literal[...]`` annotation, or ``None``.
+
+    Plain literals are read from the CST directly; anything else (e.g. ``-1``)
+    falls back to ``ast.literal_eval`` on its source.
+    """
+    if not (
+        isinstance(dtype_node, cst.Subscript)
+        and isinstance(dtype_node.value, cst.Name)
+        and dtype_node.value.value == "Literal"
+    ):
+        return None
+    choices = []
+    for element in dtype_node.slice:
+        node = element.slice.value
+        if isinstance(node, (cst.SimpleString, cst.ConcatenatedString, cst.Integer, cst.Float, cst.Name)):
+            choices.append(get_cst_value(node))
+        else:
+            choices.append(ast.literal_eval(_cst_node_to_code(node)))
+    return tuple(choices)
+
+
 def extract_param_spec(param: cst.Param) -> ParamSpec:
     """Extract a neutral :class:`ParamSpec` from a CST Param node.
 
@@ -246,14 +279,19 @@ def extract_param_spec(param: cst.Param) -> ParamSpec:
             raise ValueError("Only Annotated types are supported")
 
         dtype_str = _cst_node_to_code(dtype_node)
-        typer_metadata = extract_typer_metadata_libcst(metadata_nodes)
+        choices = _literal_choices(dtype_node)
+        # The typer call is found once and shared by metadata and comment extraction
+        typer_call = _find_typer_call(metadata_nodes)
+        typer_metadata = _typer_call_metadata(typer_call)
         stimela_metadata = extract_stimela_metadata_libcst(metadata_nodes)
+        # A comment can only ride on help=, so skip the argument scan without one
+        inline_comment = _extract_inline_comment_from_help_string(typer_call) if "help" in typer_metadata else None
     else:
         dtype_str = "str"
+        choices = None
         typer_metadata = {}
         stimela_metadata = {}
-
-    inline_comment = _extract_inline_comment_from_help_string(param)
+        inline_comment = None
 
     if param.default is not None:
         default = get_cst_value(param.default)
@@ -275,6 +313,7 @@ def extract_param_spec(param: cst.Param) -> ParamSpec:
         stimela_meta=dict(stimela_metadata),
         raw_typer_meta=dict(typer_metadata),
         inline_comment=inline_comment,
+        choices=choices,
     )
 
 
@@ -307,24 +346,21 @@ def param_spec_to_cab_input(spec: ParamSpec) -> tuple[str, dict[str, Any]]:
             input_def["dtype"] = dtype
     else:
         dtype = _dtype_to_str_from_string(spec.dtype_str)
-        if dtype != "str" and dtype != "NoneType":
-            if "Literal" in dtype:
-                input_def["choices"] = ast.literal_eval(dtype.removeprefix("Literal").strip())
-            else:
-                input_def["dtype"] = dtype
+        if spec.choices is not None:
+            input_def["choices"] = list(spec.choices)
+        elif dtype != "str" and dtype != "NoneType":
+            input_def["dtype"] = dtype
 
+    # Build each policies dict in one literal; params without policies get no key
+    is_list = dtype == "list" or dtype == "List"
     if spec.required:
         input_def["required"] = True
-        input_def["policies"] = {}
-        input_def["policies"]["positional"] = True
-        if dtype == "list" or dtype == "List":
-            input_def["policies"]["repeat"] = "list"
+        input_def["policies"] = {"positional": True, "repeat": "list"} if is_list else {"positional": True}
     else:
         if spec.default is not None:
             input_def["default"] = _normalize_list_default(dtype, spec.default)
-        if dtype == "list" or dtype == "List":
-            input_def["policies"] = {}
-            input_def["policies"]["repeat"] = "list"
+        if is_list:
+            input_def["policies"] = {"repeat": "list"}
 
     rich_help_panel = spec.raw_typer_meta.get("rich_help_panel")
     if rich_help_panel:
@@ -360,11 +396,24 @@ def extract_input_libcst(param: cst.Param) -> tuple[str, dict[str, Any]]:
     return param_spec_to_cab_input(extract_param_spec(param))
 
 
+# A None member of a union ("X | None" / "None | X", any spacing), removed in one subn
+_NONE_UNION_MEMBER_RE = re.compile(r"\s*\|\s*None\b|\bNone\s*\|\s*")
+
+# Lowercase builtin generics, bare or subscripted, mapped to stimela names
+_BUILTIN_GENERIC_RE = re.compile(r"(list|dict|set|tuple)(?=\[|$)")
+_BUILTIN_GENERICS = {"list": "List", "dict": "Dict", "set": "Set", "tuple": "Tuple"}
+
+# Custom list NewTypes and the stimela dtypes they stand for
+_LIST_NEWTYPE_DTYPES = {"ListInt": "List[int]", "ListFloat": "List[float]", "ListStr": "List[str]"}
+
+
+@functools.lru_cache(maxsize=2048)
 def _dtype_to_str_from_string(dtype_str: str) -> str:
     """
     Normalize a dtype string representation for stimela compatibility.
 
     Handles string-based dtype normalization without runtime type objects.
+    Cached, since the same annotation strings recur across a module's commands.
 
     Args:
         dtype_str: String representation of the type (e.g., "File", "str | None", "list[File]")
@@ -375,12 +424,9 @@ def _dtype_to_str_from_string(dtype_str: str) -> str:
     # Strip whitespace
     dtype_str = dtype_str.strip()
 
-    # Check if type is optional (X | None or None | X) before stripping
-    is_optional = " | None" in dtype_str or "| None" in dtype_str or "None |" in dtype_str or "None|" in dtype_str
-
-    # Remove None from union types (handles both X | None and None | X)
-    dtype_str = dtype_str.replace(" | None", "").replace("| None", "")
-    dtype_str = dtype_str.replace("None | ", "").replace("None|", "")
+    # Remove None from union types (X | None or None | X); any removal makes it optional
+    dtype_str, n_none = _NONE_UNION_MEMBER_RE.subn("", dtype_str)
+    is_optional = n_none > 0
 
     # If it's just "None", return "NoneType"
     if dtype_str == "None":
@@ -391,38 +437,63 @@ def _dtype_to_str_from_string(dtype_str: str) -> str:
         return "str"
 
     # Map custom list NewTypes to their stimela dtypes
-    list_type_mapping = {
-        "ListInt": "List[int]",
-        "ListFloat": "List[float]",
-        "ListStr": "List[str]",
-    }
-    if dtype_str in list_type_mapping:
-        resolved = list_type_mapping[dtype_str]
+    resolved = _LIST_NEWTYPE_DTYPES.get(dtype_str)
+    if resolved is not None:
         return f"Optional[{resolved}]" if is_optional else resolved
 
     # Map lowercase built-in types to stimela-compatible names
     # Handle both simple types (list) and generic types (list[File])
-    type_mapping = {
-        "list": "List",
-        "dict": "Dict",
-        "set": "Set",
-        "tuple": "Tuple",
-    }
-
-    # Check for generic types like list[File], dict[str, int], etc.
-    for old, new in type_mapping.items():
-        # Replace "list[" with "List[" (preserve brackets and contents)
-        if dtype_str.startswith(f"{old}["):
-            resolved = f"{new}{dtype_str[len(old) :]}"
-            return f"Optional[{resolved}]" if is_optional else resolved
-        # Simple type without brackets
-        elif dtype_str == old:
-            return f"Optional[{new}]" if is_optional else new
+    generic_match = _BUILTIN_GENERIC_RE.match(dtype_str)
+    if generic_match:
+        resolved = _BUILTIN_GENERICS[generic_match.group(1)] + dtype_str[generic_match.end() :]
+        return f"Optional[{resolved}]" if is_optional else resolved
 
     # Return as-is for custom types like File, Directory, etc.
     return f"Optional[{dtype_str}]" if is_optional else dtype_str
 
 
+def _simple_string_value(node: cst.SimpleString) -> str:
+    """Value of a string literal.
+
+    Plain string literals dominate decorator kwargs. Without a prefix or
+    escapes the value is just the text between the quotes, which skips the
+    literal_eval behind SimpleString.evaluated_value.
+    """
+    text = node.value
+    if text[0] in "\"'" and "\\" not in text:
+        quote_len = 3 if text[:3] in ('"""', "'''") and len(text) >= 6 else 1
+        return text[quote_len:-quote_len]
+    return node.evaluated_value
+
+
+def _dict_value(node: cst.Dict) -> dict:
+    """Value of a dict display (``**`` splats are skipped)."""
+    result = {}
+    for element in node.elements:
+        if isinstance(element, cst.DictElement):
+            key = get_cst_value(element.key)
+            value = get_cst_value(element.value)
+            result[key] = value
+    return result
+
+
+# Booleans and None are Name nodes; any other name is returned as a string
+_NAME_CONSTANTS = {"True": True, "False": False, "None": None}
+
+# get_cst_value handlers keyed on the exact node type
+_CST_VALUE_HANDLERS = {
+    cst.SimpleString: _simple_string_value,
+    cst.ConcatenatedString: lambda node: node.evaluated_value,
+    cst.Name: lambda node: _NAME_CONSTANTS.get(node.value, node.value),
+    cst.Integer: lambda node: int(node.value),
+    cst.Float: lambda node: float(node.value),
+    cst.Ellipsis: lambda node: ...,
+    cst.List: lambda node: [get_cst_value(el.value) for el in node.elements],
+    cst.Dict: _dict_value,
+    cst.Tuple: lambda node: tuple(get_cst_value(el.value) for el in node.elements),
+}
+
+
 def get_cst_value(node: cst.CSTNode) -> Any:
     """
     Extract the Python value directly from a LibCST node.
@@ -436,51 +507,17 @@ def get_cst_value(node: cst.CSTNode) -> Any:
     Returns:
         The Python value represented by the node
     """
-    # Ellipsis (...)
-    if isinstance(node, cst.Ellipsis):
-        return ...
-
-    # Primitives
-    if isinstance(node, cst.Integer):
-        return int(node.value)
-    elif isinstance(node, cst.Float):
-        return float(node.value)
-
-    # Strings (handles both simple and concatenated automatically)
-    elif isinstance(node, (cst.SimpleString, cst.ConcatenatedString)):
-        return node.evaluated_value
-
-    # Booleans and None (represented as Name nodes)
-    elif isinstance(node, cst.Name):
-        if node.value == "True":
-            return True
-        elif node.value == "False":
-            return False
-        elif node.value == "None":
-            return None
-        else:
-            # Unknown name, return as string
-            return node.value
-
-    # Collections - recursive
-    elif isinstance(node, cst.List):
-        return [get_cst_value(el.value) for el in node.elements]
+    handler = _CST_VALUE_HANDLERS.get(type(node))
+    if handler is not None:
+        return handler(node)
 
-    elif isinstance(node, cst.Dict):
-        result = {}
-        for element in node.elements:
-            if isinstance(element, cst.DictElement):
-                key = get_cst_value(element.key)
-                value = get_cst_value(element.value)
-                result[key] = value
-        return result
+    # For complex expressions we can't evaluate, return code representation
+    return _cst_node_to_code(node)
 
-    elif isinstance(node, cst.Tuple):
-        return tuple(get_cst_value(el.value) for el in node.elements)
 
-    # For complex expressions we can't evaluate, return code representation
-    else:
-        return cst.Module([]).code_for_node(node).strip()
+# Shared renderer for _cst_node_to_code; code_for_node only reads the module's
+# formatting defaults, so one empty module serves every call
+_EMPTY_MODULE = cst.Module([])
 
 
 def _cst_node_to_code(node: cst.CSTNode) -> str:
@@ -493,10 +530,10 @@ def _cst_node_to_code(node: cst.CSTNode) -> str:
     Returns:
         String representation of the node's code
     """
-    return cst.Module([]).code_for_node(node).strip()
+    return _EMPTY_MODULE.code_for_node(node).strip()
 
 
-def _extract_inline_comment_from_help_string(param: cst.Param) -> str | None:
+def _extract_inline_comment_from_help_string(typer_call: cst.Call) -> str | None:
     """
     Extract inline comments from help string in typer.Option() call.
 
@@ -504,49 +541,19 @@ def _extract_inline_comment_from_help_string(param: cst.Param) -> str | None:
     not in param.default.
 
     Args:
-        param: LibCST Param node to analyze
+        typer_call: The parameter's typer call, as found by :func:`_find_typer_call`
 
     Returns:
         Inline comment string (including # prefix) if found, None otherwise
     """
-    if param.annotation is None:
-        return None
-
-    annotation = param.annotation.annotation
-
-    # annotation should be Annotated[...]
-    if not isinstance(annotation, cst.Subscript):
-        return None
-
-    # Check if it's Annotated
-    if not (isinstance(annotation.value, cst.Name) and annotation.value.value == "Annotated"):
-        return None
-
-    # Get the subscript elements (should be a tuple with at least 2 elements)
-    slice_elements = annotation.slice
-    if not isinstance(slice_elements, (list, tuple)) or len(slice_elements) < 2:
-        return None
-
-    # The second element should be typer.Option(...)
-    second_element = slice_elements[1]
-    if not isinstance(second_element.slice, cst.Index):
-        return None
-
-    option_call = second_element.slice.value
-    if not isinstance(option_call, cst.Call):
-        return None
-
     # Find the help keyword argument
-    for arg in option_call.args:
+    for arg in typer_call.args:
         if arg.keyword is not None and arg.keyword.value == "help":
-            # Check whitespace_after_arg for comments
-            if hasattr(arg, "whitespace_after_arg"):
-                ws_after = arg.whitespace_after_arg
-                # Could be ParenthesizedWhitespace
-                if hasattr(ws_after, "first_line"):
-                    first_line = ws_after.first_line
-                    if hasattr(first_line, "comment") and first_line.comment is not None:
-                        return first_line.comment.value  # Returns the full comment including #
+            # Only ParenthesizedWhitespace (a line break after the arg) has a first_line
+            first_line = getattr(arg.whitespace_after_arg, "first_line", None)
+            comment = getattr(first_line, "comment", None)
+            if comment is not None:
+                return comment.value  # Returns the full comment including #
 
     return None
 
@@ -566,14 +573,11 @@ def parse_decorator_libcst(dec: cst.Decorator) -> dict:
         args = []
         kwargs = {}
         for arg in call.args:
-            # Check for inline comments after this argument (in the comma's whitespace)
-            inline_comment = None
-            if arg.comma is not None and hasattr(arg.comma, "whitespace_after"):
-                ws_after = arg.comma.whitespace_after
-                if hasattr(ws_after, "first_line"):
-                    first_line = ws_after.first_line
-                    if hasattr(first_line, "comment") and first_line.comment is not None:
-                        inline_comment = first_line.comment.value
+            # Check for inline comments after this argument (in the comma's whitespace;
+            # the comma may be a MaybeSentinel, and only a line break has a first_line)
+            first_line = getattr(getattr(arg.comma, "whitespace_after", None), "first_line", None)
+            comment = getattr(first_line, "comment", None)
+            inline_comment = comment.value if comment is not None else None
 
             if arg.keyword is None:
                 # Positional argument - keep as code string
@@ -597,6 +601,10 @@ def parse_decorator_libcst(dec: cst.Decorator) -> dict:
         raise ValueError("Unsupported decorator format")
 
 
+# Decorator names parse_module extracts from a CLI module
+_STIMELA_DECORATORS = frozenset({"stimela_cab", "stimela_output"})
+
+
 def parse_module(module_path: Path) -> ModuleSpec:
     """Parse one CLI module and return all ``@stimela_cab`` commands as a :class:`ModuleSpec`.
 
@@ -622,6 +630,10 @@ def parse_module(module_path: Path) -> ModuleSpec:
 
         decorators: dict[str, dict[str, Any]] = {}
         for dec in node.decorators:
+            # Only stimela decorators are parsed; others (e.g. functools caches) are ignored
+            target = dec.decorator.func if isinstance(dec.decorator, cst.Call) else dec.decorator
+            if cst.helpers.get_full_name_for_node(target) not in _STIMELA_DECORATORS:
+                continue
             deco_name, deco_args = parse_decorator_libcst(dec)
             decorators[deco_name] = deco_args
 
@@ -641,6 +653,12 @@ def parse_module(module_path: Path) -> ModuleSpec:
     return ModuleSpec(path=module_path, commands=tuple(commands))
 
 
+_INFO_FIELD_RE = re.compile(r"^(\s*)(info|implicit):\s*(.*)$")
+_YAML_KEY_RE = re.compile(r"^\s*\w+:")
+# PEP 8 inline comment: at least two spaces before the #
+_TRAILING_COMMENT_RE = re.compile(r"\s{2,}#")
+
+
 def format_info_fields(yaml_str, comment_map=None):
     """
     Replace inline info strings with multi-line format.
@@ -656,26 +674,28 @@ def format_info_fields(yaml_str, comment_map=None):
     """
     # Process line by line to handle wrapped content
     lines = yaml_str.split("\n")
+    n = len(lines)
     result = []
     i = 0
 
-    while i < len(lines):
+    while i < n:
         line = lines[i]
 
-        # Match both 'info:' and 'implicit:' fields
-        match = re.match(r"^(\s*)(info|implicit):\s*(.*)$", line)
+        # Match both 'info:' and 'implicit:' fields; the substring test skips the
+        # regex engine for the vast majority of lines, which have neither
+        match = ("info:" in line or "implicit:" in line) and _INFO_FIELD_RE.match(line)
 
         if match:
             indent = match.group(1)
             field_name = match.group(2)
-            content = match.group(3)
+            parts = [match.group(3)]
 
             # Collect continuation lines (indented more than 'field:')
-            cond1 = i + 1 < len(lines)
-            while cond1 and lines[i + 1].startswith(indent + "  ") and not re.match(r"^\s*\w+:", lines[i + 1]):
+            continuation_indent = indent + "  "
+            while i + 1 < n and lines[i + 1].startswith(continuation_indent) and not _YAML_KEY_RE.match(lines[i + 1]):
                 i += 1
-                content += " " + lines[i].strip()
-                cond1 = i + 1 < len(lines)
+                parts.append(lines[i].strip())
+            content = " ".join(parts)
 
             # Strip quotes (YAML adds them for strings with special chars)
             content = content.strip().strip("'\"")
@@ -684,7 +704,7 @@ def format_info_fields(yaml_str, comment_map=None):
             # PEP 8: inline comments should have at least 2 spaces before the #
             # Use regex to match 2+ spaces before # to be flexible about whitespace
             trailing_comment = None
-            comment_match = re.search(r"\s{2,}#", content)
+            comment_match = _TRAILING_COMMENT_RE.search(content)
             if comment_match:
                 comment_idx = comment_match.start()
                 trailing_comment = content[comment_idx:].strip()
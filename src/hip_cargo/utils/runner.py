@@ -1,21 +1,32 @@
 """Container fallback execution for hip-cargo CLI commands."""
 
+import errno
+import functools
 import os
 import shlex
 import shutil
+import stat
 import subprocess
 import sys
 import types
 import typing
+from dataclasses import dataclass
 from pathlib import Path, PurePath
 
 from upath import UPath
 
 from hip_cargo.utils.config import get_container_gpu, get_container_run_args
+from hip_cargo.utils.decorators import StimelaOutput
 from hip_cargo.utils.metadata import StimelaMeta
 
 CONTAINER_RUNTIMES = ["apptainer", "singularity", "docker", "podman"]
 
+# Stand-in for params without an @stimela_output declaration.
+_NO_OUTPUT = StimelaOutput(name="", dtype="")
+
+# stat() errnos that mean "no such path", as ignored by pathlib's exists()/is_dir()
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
 _EXTRA_FOR_SCHEME: dict[str, str] = {
     "s3": "hip-cargo[s3]",
     "gs": "hip-cargo[gcs]",
@@ -162,16 +173,11 @@ def _resolve_mounts(func: typing.Callable, params: dict[str, typing.Any]) -> dic
     Returns:
         Dict mapping absolute directory paths to read-write flag (True=rw, False=ro).
     """
-    # Build output metadata lookup: param_name → output_def
-    output_meta: dict[str, dict] = {}
-    for output_def in getattr(func, "__stimela_outputs__", []):
-        py_name = output_def["name"].replace("-", "_")
-        output_meta[py_name] = output_def
-
-    # Extract stimela metadata from Annotated type hints
-    stimela_meta = _extract_stimela_meta_from_hints(func)
-
-    hints = _hints_with_extras(func)
+    # Hints, stimela metadata and output lookup (param_name → output_def)
+    command_meta = _command_meta(func)
+    output_meta = command_meta.outputs
+    stimela_meta = command_meta.stimela_meta
+    hints = command_meta.hints
     mounts: dict[str, bool] = {}
 
     def add_mount(path: str, readwrite: bool) -> None:
@@ -189,11 +195,11 @@ def _resolve_mounts(func: typing.Callable, params: dict[str, typing.Any]) -> dic
 
         # Gather path_policies from output decorator and/or stimela metadata dict
         meta = stimela_meta.get(param_name, {})
-        output_def = output_meta.get(param_name, {})
-        base_policies = output_def.get("path_policies") or {}
+        output_def = output_meta.get(param_name, _NO_OUTPUT)
+        base_policies = output_def.path_policies
         path_policies = {**base_policies, **meta.get("path_policies", {})}
-        must_exist = meta.get("must_exist", output_def.get("must_exist"))
-        do_mkdir = meta.get("mkdir", output_def.get("mkdir", False))
+        must_exist = meta.get("must_exist", output_def.must_exist)
+        do_mkdir = meta.get("mkdir", output_def.mkdir)
         write_parent = path_policies.get("write_parent", False)
         access_parent = path_policies.get("access_parent", False)
 
@@ -205,7 +211,6 @@ def _resolve_mounts(func: typing.Callable, params: dict[str, typing.Any]) -> dic
             if not isinstance(p, Path):
                 continue
             abs_path = p.resolve()
-            path_str = str(abs_path)
 
             if write_parent or do_mkdir:
                 # Mount the parent directory rw instead of the path itself.
@@ -213,15 +218,27 @@ def _resolve_mounts(func: typing.Callable, params: dict[str, typing.Any]) -> dic
                 # missing parents and avoids root-owned auto-create on docker.
                 target = _resolve_mountable_ancestor(abs_path.parent)
                 add_mount(str(target), True)
-            elif abs_path.is_dir():
-                add_mount(path_str, is_output)
-            elif abs_path.exists():
-                add_mount(str(abs_path.parent), is_output)
             else:
-                if must_exist:
-                    raise RuntimeError(f"Parameter '{param_name}': path '{abs_path}' does not exist")
-                target = _resolve_mountable_ancestor(abs_path.parent)
-                add_mount(str(target), is_output)
+                # One stat answers both "is it a directory" and "does it exist"
+                try:
+                    mode = abs_path.stat().st_mode
+                except OSError as e:
+                    if e.errno not in _MISSING_PATH_ERRNOS:
+                        raise
+                    mode = None
+                except ValueError:
+                    # e.g. an embedded NUL byte, which exists() also reports as missing
+                    mode = None
+
+                if mode is None:
+                    if must_exist:
+                        raise RuntimeError(f"Parameter '{param_name}': path '{abs_path}' does not exist")
+                    target = _resolve_mountable_ancestor(abs_path.parent)
+                    add_mount(str(target), is_output)
+                elif stat.S_ISDIR(mode):
+                    add_mount(str(abs_path), is_output)
+                else:
+                    add_mount(str(abs_path.parent), is_output)
 
             if access_parent and not write_parent:
                 target = _resolve_mountable_ancestor(abs_path.parent)
@@ -249,15 +266,14 @@ def _resolve_implicit_output_mounts(
     """Add RW mounts for implicit outputs that aren't CLI parameters."""
     fmt_args: dict[str, str] | None = None  # built lazily
     for output_def in getattr(func, "__stimela_outputs__", []):
-        py_name = output_def["name"].replace("-", "_")
-        if py_name in params:
+        if output_def.py_name in params:
             continue  # handled by the param loop
 
-        implicit = output_def.get("implicit", False)
+        implicit = output_def.implicit
         if not isinstance(implicit, str):
             continue  # True/False sentinel — not a path
 
-        if output_def.get("dtype") not in _PATH_DTYPES:
+        if output_def.dtype not in _PATH_DTYPES:
             continue
 
         if fmt_args is None:
@@ -277,9 +293,9 @@ def _resolve_implicit_output_mounts(
         abs_path = Path(path_str).resolve()
         path_str_resolved = str(abs_path)
 
-        base_policies = output_def.get("path_policies") or {}
-        do_mkdir = output_def.get("mkdir", False)
-        must_exist = output_def.get("must_exist", False)
+        base_policies = output_def.path_policies
+        do_mkdir = output_def.mkdir
+        must_exist = output_def.must_exist
         write_parent = base_policies.get("write_parent", False)
         access_parent = base_policies.get("access_parent", False)
 
@@ -292,7 +308,7 @@ def _resolve_implicit_output_mounts(
             add_mount(str(abs_path.parent), True)
         else:
             if must_exist:
-                raise RuntimeError(f"Implicit output '{output_def['name']}': path '{abs_path}' does not exist")
+                raise RuntimeError(f"Implicit output '{output_def.name}': path '{abs_path}' does not exist")
             target = _resolve_mountable_ancestor(abs_path.parent)
             add_mount(str(target), True)
 
@@ -301,6 +317,41 @@ def _resolve_implicit_output_mounts(
             add_mount(str(target), False)
 
 
+@dataclass(frozen=True, slots=True)
+class _CommandMeta:
+    """Everything the runner reads off a decorated CLI function, gathered once.
+
+    Attributes:
+        hints: Annotated-preserving type hints (see :func:`_hints_with_extras`).
+        stimela_meta: Param name → stimela metadata from the Annotated hints.
+        outputs: Python param name → ``@stimela_output`` record.
+        declares_must_exist: Whether any param or output sets ``must_exist``.
+    """
+
+    hints: dict[str, typing.Any]
+    stimela_meta: dict[str, typing.Mapping]
+    outputs: dict[str, StimelaOutput]
+    declares_must_exist: bool
+
+
+@functools.cache
+def _command_meta(func: typing.Callable) -> _CommandMeta:
+    """Collect a function's hints, stimela metadata and outputs in one pass.
+
+    Annotations and decorators are fixed once the function is defined, so the
+    record is built once per function and shared by mount resolution, the
+    remote-protocol scan and the must_exist preflight. Callers must treat the
+    contained dicts as read-only.
+    """
+    hints = _hints_with_extras(func)
+    stimela_meta = _extract_stimela_meta_from_hints(hints)
+    outputs = {output_def.py_name: output_def for output_def in getattr(func, "__stimela_outputs__", [])}
+    declares_must_exist = any(meta.get("must_exist") for meta in stimela_meta.values()) or any(
+        output_def.must_exist for output_def in outputs.values()
+    )
+    return _CommandMeta(hints, stimela_meta, outputs, declares_must_exist)
+
+
 def _hints_with_extras(func: typing.Callable) -> dict[str, typing.Any]:
     """Annotated-preserving type hints for a CLI function.
 
@@ -316,23 +367,27 @@ def _hints_with_extras(func: typing.Callable) -> dict[str, typing.Any]:
     return inspect.get_annotations(func, eval_str=True)
 
 
-def _extract_stimela_meta_from_hints(func: typing.Callable) -> dict[str, typing.Mapping]:
+def _extract_stimela_meta_from_hints(hints: dict[str, typing.Any]) -> dict[str, typing.Mapping]:
     """Extract stimela metadata from a function's Annotated type hints.
 
     Accepts both the preferred ``StimelaMeta(...)`` form and the legacy
     ``{"stimela": {...}}`` dict literal form. Legacy dicts are wrapped in a
     ``StimelaMeta`` so callers always get a Mapping.
 
+    Args:
+        hints: Type hints as returned by :func:`_hints_with_extras`.
+
     Returns:
         Dict mapping parameter names to their stimela metadata mappings.
     """
     result: dict[str, typing.Mapping] = {}
-    hints = _hints_with_extras(func)
     for param_name, hint in hints.items():
-        origin = typing.get_origin(hint)
-        if origin is not typing.Annotated:
+        # Annotated aliases carry their extras on __metadata__; reading it
+        # directly skips the get_origin/get_args dispatch and tuple slice.
+        metadata = getattr(hint, "__metadata__", None)
+        if metadata is None:
             continue
-        for meta_item in typing.get_args(hint)[1:]:
+        for meta_item in metadata:
             if isinstance(meta_item, StimelaMeta):
                 result[param_name] = meta_item
                 break
@@ -344,14 +399,20 @@ def _extract_stimela_meta_from_hints(func: typing.Callable) -> dict[str, typing.
 
 def _prune_child_mounts(mounts: dict[str, bool]) -> None:
     """Remove mounts whose parent is already mounted with equal or greater privileges."""
-    to_remove = set()
-    for path, rw in list(mounts.items()):
-        parent = os.path.dirname(path)
-        while parent != "/" and parent != path:
-            if parent in mounts and mounts[parent] >= rw:
-                to_remove.add(path)
-                break
-            parent = os.path.dirname(parent)
+    # Sorting on path components puts every mount straight after its ancestors
+    # (a plain string sort would slip "/a/b-c" between "/a/b" and "/a/b/c"), so
+    # one pass over a stack of the current ancestor chain finds the redundant
+    # children. Each entry records whether any mount in the chain so far is rw.
+    to_remove = []
+    ancestors: list[tuple[list[str], bool]] = []
+    for parts, path in sorted((path.split("/"), path) for path in mounts):
+        while ancestors and parts[: len(ancestors[-1][0])] != ancestors[-1][0]:
+            ancestors.pop()
+        rw = mounts[path]
+        if ancestors and (ancestors[-1][1] or not rw):
+            to_remove.append(path)
+        if path != "/":  # "/" itself never makes a child redundant
+            ancestors.append((parts, rw or (bool(ancestors) and ancestors[-1][1])))
     for path in to_remove:
         del mounts[path]
 
@@ -359,22 +420,36 @@ def _prune_child_mounts(mounts: dict[str, bool]) -> None:
 def _is_path_type(tp: typing.Any) -> bool:
     """Check if a type hint resolves to a Path-like type.
 
-    Handles Annotated, Optional, Union, list, and NewType wrappers.
+    Hints are immutable, so results are cached per hint. Unhashable hints
+    (e.g. an ``Annotated`` carrying legacy dict metadata) are checked directly.
     """
-    origin = typing.get_origin(tp)
+    try:
+        return _is_path_type_cached(tp)
+    except TypeError:
+        return _check_path_type(tp)
+
 
-    # Annotated[X, ...] → check X
-    if origin is typing.Annotated:
-        return _is_path_type(typing.get_args(tp)[0])
+def _check_path_type(tp: typing.Any) -> bool:
+    """Uncached body of :func:`_is_path_type`.
+
+    Handles Annotated, Optional, Union, list, and NewType wrappers. Alias
+    dunders are read directly rather than through ``typing.get_origin`` /
+    ``typing.get_args``, which re-dispatch on the alias type on every call.
+    Nested hints go back through :func:`_is_path_type` and so hit the cache.
+    """
+    # Annotated[X, ...] → check X (the alias's __origin__ is X itself)
+    if hasattr(tp, "__metadata__"):
+        return _is_path_type(tp.__origin__)
+
+    origin = getattr(tp, "__origin__", None)
 
     # Union / X | None → check non-None args
-    if origin is types.UnionType or origin is typing.Union:
-        args = [a for a in typing.get_args(tp) if a is not type(None)]
-        return any(_is_path_type(a) for a in args)
+    if origin is typing.Union or isinstance(tp, types.UnionType):
+        return any(_is_path_type(a) for a in tp.__args__ if a is not type(None))
 
     # list[X] → check X
     if origin is list:
-        args = typing.get_args(tp)
+        args = getattr(tp, "__args__", ())
         return bool(args) and _is_path_type(args[0])
 
     # Path / UPath check: match pathlib hierarchy or UPath hierarchy
@@ -390,6 +465,8 @@ def _is_path_type(tp: typing.Any) -> bool:
     return False
 
 
+_is_path_type_cached = functools.lru_cache(maxsize=512)(_check_path_type)
+
 _LOCAL_PROTOCOLS = frozenset({"", "file", "local"})
 
 
@@ -426,7 +503,7 @@ def _is_remote_upath(value: typing.Any) -> bool:
 
 def _collect_remote_protocols(func: typing.Callable, params: dict[str, typing.Any]) -> set[str]:
     """Scan path-typed params and implicit outputs, return non-local protocols in use."""
-    hints = _hints_with_extras(func)
+    hints = _command_meta(func).hints
     protocols: set[str] = set()
     for name, value in params.items():
         if value is None:
@@ -444,13 +521,12 @@ def _collect_remote_protocols(func: typing.Callable, params: dict[str, typing.An
     # Implicit outputs whose template renders to a remote URI.
     fmt_args: dict[str, str] | None = None
     for output_def in getattr(func, "__stimela_outputs__", []):
-        py_name = output_def["name"].replace("-", "_")
-        if py_name in params:
+        if output_def.py_name in params:
             continue
-        implicit = output_def.get("implicit", False)
+        implicit = output_def.implicit
         if not isinstance(implicit, str):
             continue
-        if output_def.get("dtype") not in _PATH_DTYPES:
+        if output_def.dtype not in _PATH_DTYPES:
             continue
         if fmt_args is None:
             fmt_args = {k: ("" if v is None else str(v)) for k, v in params.items()}
@@ -473,21 +549,23 @@ def preflight_remote_must_exist(func: typing.Callable, params: dict[str, typing.
     are enforced elsewhere (mount logic for local paths; the user's own code
     otherwise). Raises ``typer.Exit(1)`` on a missing remote URI.
     """
+    # Most commands declare no must_exist at all; skip the per-param walk.
+    command_meta = _command_meta(func)
+    if not command_meta.declares_must_exist:
+        return
+
     import typer
 
-    stimela_meta = _extract_stimela_meta_from_hints(func)
-    output_meta: dict[str, dict] = {}
-    for output_def in getattr(func, "__stimela_outputs__", []):
-        py_name = output_def["name"].replace("-", "_")
-        output_meta[py_name] = output_def
+    stimela_meta = command_meta.stimela_meta
+    output_meta = command_meta.outputs
 
     for name, value in params.items():
         if value is None:
             continue
         values = value if isinstance(value, list) else [value]
         meta = stimela_meta.get(name, {})
-        output_def = output_meta.get(name, {})
-        must_exist = meta.get("must_exist", output_def.get("must_exist"))
+        output_def = output_meta.get(name, _NO_OUTPUT)
+        must_exist = meta.get("must_exist", output_def.must_exist)
         if not must_exist:
             continue
         for v in values:
@@ -503,15 +581,14 @@ def preflight_remote_must_exist(func: typing.Callable, params: dict[str, typing.
     # Implicit outputs with must_exist=True whose template renders to a remote URI.
     fmt_args: dict[str, str] | None = None
     for output_def in getattr(func, "__stimela_outputs__", []):
-        py_name = output_def["name"].replace("-", "_")
-        if py_name in params:
+        if output_def.py_name in params:
             continue
-        if not output_def.get("must_exist"):
+        if not output_def.must_exist:
             continue
-        implicit = output_def.get("implicit", False)
+        implicit = output_def.implicit
         if not isinstance(implicit, str):
             continue
-        if output_def.get("dtype") not in _PATH_DTYPES:
+        if output_def.dtype not in _PATH_DTYPES:
             continue
         if fmt_args is None:
             fmt_args = {k: ("" if v is None else str(v)) for k, v in params.items()}
@@ -527,7 +604,7 @@ def preflight_remote_must_exist(func: typing.Callable, params: dict[str, typing.
         upath = UPath(rendered)
         if not upath.exists():
             typer.echo(
-                f"Implicit output '{output_def['name']}': '{upath}' does not exist",
+                f"Implicit output '{output_def.name}': '{upath}' does not exist",
                 err=True,
             )
             raise typer.Exit(code=1)
@@ -35,6 +35,8 @@ class ParamSpec:
             (e.g. ``"# noqa: E501"``).
         line: 1-based line number of the parameter in its source module, used
             for diagnostics.
+        choices: Values of a top-level ``Literal[...]`` annotation, read
+            straight from the CST. ``None`` for any other annotation.
     """
 
     name: str
@@ -46,6 +48,7 @@ class ParamSpec:
     raw_typer_meta: dict[str, Any] = field(default_factory=dict)
     inline_comment: str | None = None
     line: int | None = None
+    choices: tuple[Any, ...] | None = None
 
     @property
     def is_tunable(self) -> bool:
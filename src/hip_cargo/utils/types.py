@@ -1,8 +1,9 @@
 """Custom types for comma-separated list parameters and URI paths."""
 
-from typing import NewType
+from typing import TYPE_CHECKING, NewType
 
-from upath import UPath
+if TYPE_CHECKING:
+    from upath import UPath
 
 ListInt = NewType("ListInt", str)
 ListFloat = NewType("ListFloat", str)
@@ -40,8 +41,14 @@ def parse_list_str(value: str | list[str]) -> list[str]:
     return [x.strip() for x in value.split(",")]
 
 
-def parse_upath(value: str) -> UPath:
-    """Parse a CLI string into a universal Path (local or remote URI)."""
+def parse_upath(value: str) -> "UPath":
+    """Parse a CLI string into a universal Path (local or remote URI).
+
+    ``upath`` (and with it fsspec) is imported on first use so that merely
+    importing hip_cargo stays cheap.
+    """
+    from upath import UPath
+
     return UPath(value)
 
 
@@ -3,6 +3,10 @@
 import re
 from pathlib import Path
 
+# Inline comment on a YAML line: content, two spaces, then "# comment". Matched
+# over the whole file, so the spaces must not be newlines (no cross-line matches)
+_INLINE_COMMENT_RE = re.compile(r"^(.+?)[^\S\n]{2}(#.+)$", re.MULTILINE)
+
 
 def extract_yaml_comments(yaml_file: Path) -> dict[str, str]:
     """
@@ -20,22 +24,22 @@ def extract_yaml_comments(yaml_file: Path) -> dict[str, str]:
     comments = {}
 
     with open(yaml_file) as f:
-        for line in f:
-            # Look for inline comments (text followed by  #comment)
-            # Pattern: content  # comment
-            match = re.match(r"^(.+?)\s\s(#.+)$", line)
-            if match:
-                content = match.group(1).strip()
-                comment = match.group(2).strip()
-
-                # Store the full content (with YAML key if present)
-                comments[content] = comment
-
-                # Also store just the value part (after colon) for fields like "implicit: value"
-                # This helps match when we have the value but not the key
-                if ": " in content:
-                    _, value = content.split(": ", 1)
-                    comments[value.strip()] = comment
+        data = f.read()
+
+    # Look for inline comments (text followed by  #comment) in one scan of the file
+    # Pattern: content  # comment
+    for match in _INLINE_COMMENT_RE.finditer(data):
+        content = match.group(1).strip()
+        comment = match.group(2).strip()
+
+        # Store the full content (with YAML key if present)
+        comments[content] = comment
+
+        # Also store just the value part (after colon) for fields like "implicit: value"
+        # This helps match when we have the value but not the key
+        if ": " in content:
+            _, value = content.split(": ", 1)
+            comments[value.strip()] = comment
 
     return comments
 
@@ -26,3 +26,34 @@ class TestGetContainerImage:
         """Non-existent package should return None (not raise)."""
         image = get_container_image("nonexistent-package-xyz-12345")
         assert image is None
+
+
+class TestGenerateCabsImageResolution:
+    """Test generate_cabs derives the image from the first module argument."""
+
+    @pytest.mark.unit
+    def test_duplicate_and_unordered_modules(self, tmp_path, monkeypatch, capsys):
+        """Modules are deduped and sorted, but the image still comes from the first argument."""
+        import shutil
+        from pathlib import Path
+
+        import yaml
+
+        from hip_cargo.core import generate_cabs as generate_cabs_module
+
+        fixture = Path("tests/fixtures/src/fixture_pkg/cli/tunable_demo.py")
+        zeta = tmp_path / "src" / "zeta_pkg" / "cli" / "tunable_demo.py"
+        alpha = tmp_path / "src" / "alpha_pkg" / "cli" / "tunable_demo.py"
+        for module_path in (zeta, alpha):
+            module_path.parent.mkdir(parents=True)
+            shutil.copy(fixture, module_path)
+
+        monkeypatch.setattr(generate_cabs_module, "get_container_image", lambda dist_name: f"ghcr.io/{dist_name}:1.0")
+        output_dir = tmp_path / "cabs"
+        generate_cabs_module.generate_cabs([zeta, alpha, zeta], output_dir=output_dir)
+
+        loaded = [line for line in capsys.readouterr().out.splitlines() if line.startswith("Loading file:")]
+        assert loaded == [f"Loading file: {alpha}", f"Loading file: {zeta}"]
+
+        cab = yaml.safe_load((output_dir / "tunable_demo.yml").read_text())
+        assert cab["cabs"]["tunable_demo"]["image"] == "ghcr.io/zeta-pkg:1.0"
@@ -61,8 +61,8 @@ class TestDecorators:
     def test_stimela_cab_decorator_adds_metadata(self, sample_function_annotated):
         """Test that @stimela_cab adds metadata to function."""
         assert hasattr(sample_function_annotated, "__stimela_cab_config__")
-        assert sample_function_annotated.__stimela_cab_config__["name"] == "test_processor_annotated"
-        assert sample_function_annotated.__stimela_cab_config__["info"] == "A test processing function"
+        assert sample_function_annotated.__stimela_cab_config__.name == "test_processor_annotated"
+        assert sample_function_annotated.__stimela_cab_config__.info == "A test processing function"
 
     @pytest.mark.unit
     def test_stimela_output_decorator_adds_metadata(self, sample_function_annotated):
@@ -70,23 +70,64 @@ class TestDecorators:
         assert hasattr(sample_function_annotated, "__stimela_outputs__")
         assert len(sample_function_annotated.__stimela_outputs__) == 1
         output = sample_function_annotated.__stimela_outputs__[0]
-        assert output["name"] == "output_file"
-        assert output["dtype"] == "File"
-        assert output["info"] == "{input_file}.processed"
+        assert output.name == "output_file"
+        assert output.dtype == "File"
+        assert output.info == "{input_file}.processed"
 
     @pytest.mark.unit
     def test_multiple_outputs(self, multi_output_function):
         """Test function with multiple @stimela_output decorators."""
         assert len(multi_output_function.__stimela_outputs__) == 2
 
-        output_names = [out["name"] for out in multi_output_function.__stimela_outputs__]
+        output_names = [out.name for out in multi_output_function.__stimela_outputs__]
         assert "output_file" in output_names
         assert "log_file" in output_names
 
         # Check required field
-        outputs_by_name = {out["name"]: out for out in multi_output_function.__stimela_outputs__}
-        assert outputs_by_name["output_file"]["required"] is True
-        assert outputs_by_name["log_file"]["required"] is False
+        outputs_by_name = {out.name: out for out in multi_output_function.__stimela_outputs__}
+        assert outputs_by_name["output_file"].required is True
+        assert outputs_by_name["log_file"].required is False
+
+    @pytest.mark.unit
+    def test_output_py_name_precomputed(self):
+        """Test that hyphenated output names get their Python name at decoration time."""
+
+        @stimela_output(name="output-dir", dtype="Directory")
+        def func():
+            pass
+
+        assert func.__stimela_outputs__[0].py_name == "output_dir"
+
+    @pytest.mark.unit
+    def test_legacy_dict_access(self):
+        """Test that metadata can still be read with the keys of the old dict form."""
+
+        @stimela_cab(name="legacy", info="Legacy access", image="ghcr.io/org/legacy:1.0")
+        @stimela_output(name="output-dir", dtype="Directory", required=True)
+        def func():
+            pass
+
+        config = func.__stimela_cab_config__
+        assert config["name"] == "legacy"
+        assert config["image"] == "ghcr.io/org/legacy:1.0"
+        assert config.get("missing") is None
+        assert "image" in config
+        assert dict(config) == {
+            "name": "legacy",
+            "info": "Legacy access",
+            "policies": {},
+            "image": "ghcr.io/org/legacy:1.0",
+        }
+        with pytest.raises(KeyError):
+            config["extra"]
+
+        output = func.__stimela_outputs__[0]
+        assert output["dtype"] == "Directory"
+        assert output.get("required") is True
+        assert "py_name" not in output
+        assert dict(output)["name"] == "output-dir"
+        with pytest.raises(KeyError):
+            output["py_name"]
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ try/except ImportError with container fallback (image present).
 
 import pytest
 
-from hip_cargo.utils.cab_to_function import generate_function_body
+from hip_cargo.utils.cab_to_function import generate_function_body, generate_parameter_signature
 
 
 class TestGenerateFunctionBodyNoImage:
@@ -19,6 +19,8 @@ class TestGenerateFunctionBodyNoImage:
         outputs = {}
 
         lines = generate_function_body(cab_def, inputs, outputs)
+        # Public API: the body is returned as a list of lines
+        assert isinstance(lines, list)
         code = "\n".join(lines)
 
         assert "from my_pkg.core.process import process as process_core" in code
@@ -210,3 +212,37 @@ class TestGenerateFunctionBodyWithImage:
         func_code += "\n".join(lines)
 
         compile(func_code, "<test>", "exec")
+
+
+class TestParameterSignatureDefaults:
+    """Default values in generated parameter signatures."""
+
+    @pytest.mark.unit
+    def test_signed_zero_defaults_not_conflated_by_cache(self):
+        """0.0 == -0.0, but a cached 0.0 signature must not be reused for -0.0."""
+        positive = generate_parameter_signature("offset", {"dtype": "float", "info": "Offset.", "default": 0.0})
+        negative = generate_parameter_signature("offset", {"dtype": "float", "info": "Offset.", "default": -0.0})
+
+        assert positive.rstrip().endswith("= 0.0,")
+        assert negative.rstrip().endswith("= -0.0,")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("dtype", "default", "expected"),
+        [
+            ("float", "1e-3", "= 0.001,"),
+            ("float", " 2.5 ", "= 2.5,"),
+            ("int", "2.0", "= 2,"),
+            ("float", "inf", "= 'inf',"),
+            ("float", "-inf", "= '-inf',"),
+            ("float", "nan", "= 'nan',"),
+            ("int", "inf", "= 'inf',"),
+            ("int", "1_000", "= '1_000',"),
+        ],
+    )
+    def test_numeric_string_defaults(self, dtype, default, expected):
+        """Only decimal/scientific strings become literals; inf, nan and the like stay quoted."""
+        signature = generate_parameter_signature("value", {"dtype": dtype, "info": "Value.", "default": default})
+
+        assert signature.rstrip().endswith(expected)
+        compile(f"def f(\n{signature}\n): ...", "<test>", "exec")
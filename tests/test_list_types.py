@@ -178,6 +178,23 @@ def test_generate_parameter_signature_list_str():
     assert "parse_list_str" in sig
 
 
+def test_generate_parameter_signature_nested_optional_list():
+    """List[Optional[int]] on an optional param without a default is itself made optional."""
+    param_def = {
+        "dtype": "List[Optional[int]]",
+        "info": "Values",
+    }
+    sig = generate_parameter_signature("values", param_def)
+
+    assert "list[int | None] | None," in sig
+    assert sig.rstrip().endswith("] = None,")
+
+    # An explicitly Optional outer type renders the same, without a doubled "| None"
+    outer = generate_parameter_signature("values", {**param_def, "dtype": "Optional[List[Optional[int]]]"})
+    assert "list[int | None] | None," in outer
+    assert "| None | None" not in outer
+
+
 def test_no_stimela_dict_for_list_types():
     """ListType params should NOT generate a stimela metadata dict."""
     param_def = {
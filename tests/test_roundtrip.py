@@ -4,6 +4,7 @@ import re
 import tempfile
 from pathlib import Path
 
+import hip_cargo
 from hip_cargo.core.generate_cabs import generate_cabs
 from hip_cargo.core.generate_function import generate_function
 
@@ -213,3 +214,187 @@ def test_roundtrip_preserves_spacing():
                 f"  String: {info_str!r}\n"
                 f"  Bad pattern at position {bad_spacing.start() if bad_spacing else 'N/A'}"
             )
+
+
+def test_generate_cabs_ignores_non_stimela_decorators(tmp_path):
+    """Stacked non-stimela decorators on a command do not break or alter cab generation."""
+    cli_source = Path("src/hip_cargo/cli/generate_cabs.py").read_text()
+    decorated = tmp_path / "src" / "hip_cargo" / "cli" / "generate_cabs.py"
+    decorated.parent.mkdir(parents=True)
+    stacked = "@functools.lru_cache(maxsize=None)\n@functools.wraps(print)\n@typer.main.get_command\n"
+    decorated.write_text(
+        "import functools\n" + cli_source.replace("\ndef generate_cabs(", f"\n{stacked}def generate_cabs(", 1)
+    )
+
+    plain_dir = tmp_path / "plain_cabs"
+    decorated_dir = tmp_path / "decorated_cabs"
+    generate_cabs([Path("src/hip_cargo/cli/generate_cabs.py")], output_dir=plain_dir)
+    generate_cabs([decorated], output_dir=decorated_dir)
+
+    plain = (plain_dir / "generate_cabs.yml").read_text()
+    assert (decorated_dir / "generate_cabs.yml").read_text() == plain
+
+
+def test_roundtrip_inline_comment_on_optional_annotated(tmp_path):
+    """A trailing comment on the help string of an Optional[Annotated[...]] param survives the round trip."""
+    cli_module = tmp_path / "src" / "fixture_pkg" / "cli" / "commented.py"
+    cli_module.parent.mkdir(parents=True)
+    cli_module.write_text(
+        "from typing import Annotated, Optional\n"
+        "\n"
+        "import typer\n"
+        "\n"
+        "from hip_cargo import stimela_cab\n"
+        "\n"
+        "\n"
+        '@stimela_cab(name="commented", info="Fixture command.")\n'
+        "def commented(\n"
+        "    label: Optional[\n"
+        "        Annotated[\n"
+        "            str,\n"
+        "            typer.Option(\n"
+        '                help="Run label."  # noqa: E501\n'
+        "            ),\n"
+        "        ]\n"
+        "    ] = None,\n"
+        "):\n"
+        "    pass\n"
+    )
+
+    cab_dir = tmp_path / "cabs"
+    generate_cabs([cli_module], output_dir=cab_dir)
+    cab_file = cab_dir / "commented.yml"
+    # The comment is kept as a YAML comment on the info line
+    assert "Run label.  # noqa: E501" in cab_file.read_text()
+
+    generated_file = tmp_path / "commented_roundtrip.py"
+    generate_function(cab_file, output_file=generated_file, config_file=Path("pyproject.toml"))
+    generated_code = generated_file.read_text()
+    compile(generated_code, str(generated_file), "exec")
+    assert 'help="Run label.",  # noqa: E501' in generated_code
+
+
+def test_generate_function_build_cache(tmp_path, monkeypatch):
+    """A fresh build cache entry is reused instead of re-parsing the cab YAML."""
+    import json
+    import os
+    import shutil
+
+    import yaml
+
+    cab_file = tmp_path / "generate_cabs.yml"
+    shutil.copy("src/hip_cargo/cabs/generate_cabs.yml", cab_file)
+    cache_dir = tmp_path / "cache"
+
+    first = tmp_path / "first.py"
+    generate_function(cab_file, output_file=first, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+    cache_files = list(cache_dir.glob("*.json"))
+    assert len(cache_files) == 1
+    entry = json.loads(cache_files[0].read_text())
+    assert entry["version"] == hip_cargo.__version__
+
+    real_safe_load = yaml.safe_load
+    calls = []
+
+    def _counting_safe_load(*args, **kwargs):
+        calls.append(1)
+        return real_safe_load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "safe_load", _counting_safe_load)
+    second = tmp_path / "second.py"
+    generate_function(cab_file, output_file=second, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+    assert second.read_text() == first.read_text()
+    assert not calls, "cab YAML should be served from the build cache"
+
+    # Touching the cab invalidates the entry
+    stat = cab_file.stat()
+    os.utime(cab_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = tmp_path / "third.py"
+    generate_function(cab_file, output_file=third, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+    assert third.read_text() == first.read_text()
+    assert len(calls) == 1
+    assert json.loads(cache_files[0].read_text())["mtime"] == cab_file.stat().st_mtime_ns
+
+    # Malformed entries are rebuilt rather than raising
+    for bad in ("not json", "[1, 2]", '{"version": null}'):
+        cache_files[0].write_text(bad)
+        generate_function(cab_file, output_file=third, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+        assert third.read_text() == first.read_text()
+    assert len(calls) == 4
+
+    # A same-tick edit (unchanged mtime, different size) also invalidates the entry
+    stat = cab_file.stat()
+    cab_file.write_text(cab_file.read_text() + "# trailing note\n")
+    os.utime(cab_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    generate_function(cab_file, output_file=third, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+    assert third.read_text() == first.read_text()
+    assert len(calls) == 5
+    assert json.loads(cache_files[0].read_text())["size"] == cab_file.stat().st_size
+
+    # Entries are renamed into place, leaving no temporary files behind
+    assert list(cache_dir.iterdir()) == cache_files
+
+
+def test_generate_function_unwritable_build_cache(tmp_path):
+    """A build cache that cannot be written is skipped instead of failing generation."""
+    cab_file = Path("src/hip_cargo/cabs/generate_cabs.yml")
+    expected = tmp_path / "expected.py"
+    generate_function(cab_file, output_file=expected, config_file=Path("pyproject.toml"))
+
+    # A regular file where the cache directory should be makes every write fail
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+    output_file = tmp_path / "out.py"
+    generate_function(cab_file, output_file=output_file, config_file=Path("pyproject.toml"), build_cache_dir=cache_dir)
+
+    assert output_file.read_text() == expected.read_text()
+    assert cache_dir.read_text() == "not a directory"
+
+
+def test_generate_function_relative_output_with_config_elsewhere(tmp_path, monkeypatch):
+    """A relative output file is still formatted when the ruff config lives in another directory."""
+    import warnings
+
+    cab_file = Path("src/hip_cargo/cabs/generate_cabs.yml").resolve()
+    config_file = Path("pyproject.toml").resolve()
+    expected = tmp_path / "expected.py"
+    generate_function(cab_file, output_file=expected, config_file=config_file)
+
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        generate_function(cab_file, output_file=Path("out.py"), config_file=config_file)
+
+    assert (workdir / "out.py").read_text() == expected.read_text()
+
+
+def test_generate_function_unfixable_violation_still_formatted(tmp_path):
+    """An unfixable lint violation is reported with ruff's diagnostics and the file is still formatted."""
+    import pytest
+
+    long_info = " ".join(["word"] * 28)
+    cab_file = tmp_path / "long.yml"
+    cab_file.write_text(
+        "cabs:\n"
+        "  long:\n"
+        "    flavour: python\n"
+        "    command: fakepkg.core.long.long\n"
+        "    name: long\n"
+        "    info: Long help.\n"
+        "    inputs:\n"
+        "      value:\n"
+        "        dtype: str\n"
+        "        default: abc\n"
+        f"        info: {long_info}\n"
+        "    outputs: {}\n"
+    )
+
+    output_file = tmp_path / "long.py"
+    with pytest.warns(UserWarning, match="E501"):
+        generate_function(cab_file, output_file=output_file, config_file=Path("pyproject.toml"))
+
+    generated_code = output_file.read_text()
+    compile(generated_code, str(output_file), "exec")
+    assert '] = "abc",' in generated_code
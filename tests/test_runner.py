@@ -1,5 +1,7 @@
 """Tests for container fallback runner."""
 
+import errno
+import os
 from pathlib import Path
 from typing import Annotated, NewType
 from unittest.mock import patch
@@ -85,6 +87,16 @@ class TestIsPathType:
     def test_annotated_optional_file(self):
         assert _is_path_type(Annotated[File | None, typer.Option(help="test")]) is True
 
+    @pytest.mark.unit
+    def test_annotated_unhashable_metadata(self):
+        """Legacy dict metadata makes the hint unhashable; the uncached check is used instead."""
+        file_hint = Annotated[File, typer.Option(help="test"), {"stimela": {"must_exist": True}}]
+        str_hint = Annotated[str | None, typer.Option(help="test"), {"stimela": {"dtype": "str"}}]
+        with pytest.raises(TypeError):
+            hash(file_hint)
+        assert _is_path_type(file_hint) is True
+        assert _is_path_type(str_hint) is False
+
 
 class TestResolveMounts:
     """Test _resolve_mounts with decorated functions."""
@@ -185,6 +197,77 @@ class TestResolveMounts:
         mounts = _resolve_mounts(func, {"threshold": 0.5})
         assert len(mounts) == 0
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("err", [errno.ELOOP, errno.EBADF, errno.ENOTDIR, errno.ENOENT])
+    def test_missing_path_errnos_mount_parent(self, tmp_path, err):
+        """stat() errors that pathlib's exists() treats as missing mount the parent."""
+        from hip_cargo.utils.decorators import stimela_cab, stimela_output
+
+        @stimela_cab(name="test", info="test")
+        @stimela_output(name="output-dir", dtype="Directory", info="output")
+        def func(output_dir: Annotated[Directory | None, typer.Option(parser=Path, help="output")] = None):
+            pass
+
+        output_dir = tmp_path / "results"
+        real_stat = Path.stat
+
+        def fake_stat(self, *args, **kwargs):
+            if self == output_dir:
+                raise OSError(err, os.strerror(err), str(self))
+            return real_stat(self, *args, **kwargs)
+
+        # Python < 3.12 resolve() probes stat() itself and turns ELOOP into RuntimeError,
+        # so keep resolve() out of the way to exercise the stat in _resolve_mounts
+        with patch.object(Path, "stat", fake_stat), patch.object(Path, "resolve", lambda self, strict=False: self):
+            mounts = _resolve_mounts(func, {"output_dir": output_dir})
+        assert mounts == {str(tmp_path): True}
+
+    @pytest.mark.unit
+    def test_stat_value_error_mounts_parent(self, tmp_path):
+        """A ValueError from stat() (e.g. an embedded NUL) counts as missing, as in pathlib's exists()."""
+        from hip_cargo.utils.decorators import stimela_cab, stimela_output
+
+        @stimela_cab(name="test", info="test")
+        @stimela_output(name="output-dir", dtype="Directory", info="output")
+        def func(output_dir: Annotated[Directory | None, typer.Option(parser=Path, help="output")] = None):
+            pass
+
+        output_dir = tmp_path / "results"
+        real_stat = Path.stat
+
+        def fake_stat(self, *args, **kwargs):
+            if self == output_dir:
+                raise ValueError("embedded null byte")
+            return real_stat(self, *args, **kwargs)
+
+        with patch.object(Path, "stat", fake_stat), patch.object(Path, "resolve", lambda self, strict=False: self):
+            mounts = _resolve_mounts(func, {"output_dir": output_dir})
+        assert mounts == {str(tmp_path): True}
+
+    @pytest.mark.unit
+    def test_other_stat_errors_propagate(self, tmp_path):
+        """stat() errors such as EACCES are not mistaken for a missing path."""
+        from hip_cargo.utils.decorators import stimela_cab
+
+        @stimela_cab(name="test", info="test")
+        def func(input_file: Annotated[File, typer.Option(..., parser=Path, help="input")]):
+            pass
+
+        input_file = tmp_path / "data.ms"
+        real_stat = Path.stat
+
+        def fake_stat(self, *args, **kwargs):
+            if self == input_file:
+                raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(self))
+            return real_stat(self, *args, **kwargs)
+
+        with (
+            patch.object(Path, "stat", fake_stat),
+            patch.object(Path, "resolve", lambda self, strict=False: self),
+            pytest.raises(PermissionError),
+        ):
+            _resolve_mounts(func, {"input_file": input_file})
+
 
 class TestBuildArgv:
     """Test _build_argv_with_native_backend."""
@@ -408,6 +408,34 @@ def foo(
     print("✓ Backward compatibility maintained")
 
 
+def test_unspaced_optional_union():
+    """Unspaced unions such as ``int|None`` and ``None|str`` are recognized as Optional."""
+    code = """
+from typing import Annotated
+import typer
+
+def foo(
+    count: Annotated[
+        int|None,
+        typer.Option(help="Count"),
+    ] = None,
+    name: Annotated[
+        None|str,
+        typer.Option(help="Name"),
+    ] = None,
+):
+    pass
+"""
+    cst_tree = cst.parse_module(code)
+    cst_func = cst_tree.body[-1]
+
+    _, count_def = extract_input_libcst(cst_func.params.params[0])
+    _, name_def = extract_input_libcst(cst_func.params.params[1])
+
+    assert count_def["dtype"] == "Optional[int]"
+    assert name_def["dtype"] == "Optional[str]"
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Testing Stimela Metadata Feature")